@@ -3,6 +3,9 @@
 import click
 
 from ewr_so_se_2024.approximation_of_pi import (
+    bbp,
+    benchmark,
+    digits,
     memory,
     runtime,
     convergence,
@@ -15,13 +18,18 @@ def cli():
     Command-line interface for the approximation of Pi report for the EWR (SoSe2024) course.
 
     This CLI provides commands to run various modules related to the approximation of Pi,
-    including runtime analysis, convergence analysis, and memory usage plotting.
+    including runtime analysis, convergence analysis, memory usage plotting,
+    benchmarking, streaming the digits of Pi and extracting hexadecimal digits.
     """
 
 
 cli.add_command(runtime.main, name="runtime")
 cli.add_command(convergence.main, name="convergence")
 cli.add_command(memory.plot_memory_usage, name="plot-memory-usage")
+cli.add_command(benchmark.main, name="benchmark")
+cli.add_command(digits.main, name="digits")
+cli.add_command(bbp.hex_digits, name="hex-digits")
+cli.add_command(bbp.spot_check, name="spot-check")
 
 # Note that the `__name__ == "__main__"` expression is not required here since
 # this module is only loaded if somebody loads it as the top level module.
@@ -0,0 +1,275 @@
+"""
+Hexadecimal Digit Extraction of Pi using the Bailey-Borwein-Plouffe Formula
+
+This module provides a command-line interface (CLI) for computing hexadecimal digits
+of Pi at arbitrary positions, without computing any of the digits before them. The
+Bailey-Borwein-Plouffe (BBP) formula
+
+    pi = sum_k 1/16^k (4/(8k+1) - 2/(8k+4) - 1/(8k+5) - 1/(8k+6))
+
+is multiplied by 16^d, so that the digits from position d onwards are the fractional
+part of the result. The terms up to k = d are reduced using modular exponentiation,
+the remaining terms vanish quickly. All of the arithmetic is done on scaled integers.
+
+Since the digits are independent of each other, ranges of digits can be split across
+worker processes. They also provide an independent spot-check of the approximations
+of other sequences, comparing a few random hexadecimal digits instead of recomputing
+all of them.
+
+Functions:
+    bbp_series(j, position, shift):
+        Evaluate the fractional part of one of the series of the BBP formula.
+    pi_hex_digits(position, count):
+        Compute hexadecimal digits of Pi starting at a given position.
+    pi_hex_digits_in_parallel(position, count, jobs):
+        Compute a range of hexadecimal digits of Pi using a process pool.
+    hex_digits_of(approximation, position, count):
+        Get hexadecimal digits of the fractional part of a Decimal.
+    trusted_hex_digits(precision):
+        Get the number of hexadecimal digits covered by a decimal precision.
+
+Commands:
+    hex_digits: Print hexadecimal digits of Pi starting at a given position.
+    spot_check: Compare random hexadecimal digits of approximations with the BBP formula.
+
+Example:
+    approximation-of-pi hex-digits --position 1000000 --count 16
+    approximation-of-pi spot-check -s Chudnovsky -s GaussLegendre --precision 5000
+"""
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+import click
+
+from ewr_so_se_2024.approximation_of_pi import utils
+
+# The coefficients of the series of the BBP formula, keyed by j in 1/(8k+j)
+BBP_COEFFICIENTS = {1: 4, 4: -2, 5: -1, 6: -1}
+
+
+def bbp_series(j: int, position: int, shift: int) -> int:
+    """Evaluate the fractional part of 16^position * sum_k 1/(16^k (8k+j)).
+
+    Args:
+        j (int): The offset of the denominators 8k+j.
+        position (int): The exponent of the factor 16^position.
+        shift (int): The number of fractional bits of the result.
+
+    Returns:
+        int: The fractional part multiplied by 2^shift, up to a truncation error of
+             one unit per evaluated term.
+    """
+    mask = (1 << shift) - 1
+    total = 0
+    # The terms with a non-negative power of 16, reduced modulo their denominator
+    for k in range(position + 1):
+        denominator = 8 * k + j
+        total += (pow(16, position - k, denominator) << shift) // denominator
+    total &= mask
+
+    # The terms with a negative power of 16, until they drop below one unit
+    k = position + 1
+    numerator = 1 << (shift - 4)
+    while numerator:
+        total += numerator // (8 * k + j)
+        numerator >>= 4
+        k += 1
+    return total & mask
+
+
+def pi_hex_digits(position: int, count: int = 8) -> str:
+    """Compute hexadecimal digits of Pi starting at a given position.
+
+    Args:
+        position (int): The position of the first digit after the hexadecimal point,
+                        starting at 0 for the digit 2 of 3.243F6A88...
+        count (int): The number of digits to compute.
+
+    Returns:
+        str: The hexadecimal digits in upper case.
+    """
+    # Guard digits absorb the truncation errors of all of the evaluated terms
+    guard_digits = 4 + len(f"{position:x}")
+    shift = 4 * (count + guard_digits)
+    fraction = (
+        sum(
+            coefficient * bbp_series(j, position, shift)
+            for j, coefficient in BBP_COEFFICIENTS.items()
+        )
+        & (1 << shift) - 1
+    )
+    return f"{fraction >> 4 * guard_digits:0{count}X}"
+
+
+def pi_hex_digits_in_parallel(position: int, count: int, jobs: int) -> str:
+    """Compute a range of hexadecimal digits of Pi using a process pool.
+
+    The range is split into disjoint, contiguous parts of roughly equal length,
+    each of which is computed by a worker of its own.
+
+    Args:
+        position (int): The position of the first digit after the hexadecimal point.
+        count (int): The number of digits to compute.
+        jobs (int): The number of worker processes.
+
+    Returns:
+        str: The hexadecimal digits in upper case.
+    """
+    bounds = [position + count * job // jobs for job in range(jobs + 1)]
+    parts = [(start, stop - start) for start, stop in zip(bounds, bounds[1:])]
+    parts = [(start, length) for start, length in parts if length > 0]
+    if len(parts) == 1:
+        return pi_hex_digits(position, count)
+
+    with ProcessPoolExecutor(len(parts)) as executor:
+        return "".join(executor.map(pi_hex_digits, *zip(*parts)))
+
+
+def hex_digits_of(approximation: Decimal, position: int, count: int) -> str:
+    """Get hexadecimal digits of the fractional part of a Decimal.
+
+    Args:
+        approximation (Decimal): A finite, non-negative Decimal.
+        position (int): The position of the first digit after the hexadecimal point.
+        count (int): The number of digits.
+
+    Returns:
+        str: The hexadecimal digits in upper case.
+    """
+    _, coefficient_digits, exponent = approximation.as_tuple()
+    coefficient = int("".join(map(str, coefficient_digits)))
+    if exponent >= 0:
+        scaled = coefficient * 10**exponent << 4 * (position + count)
+    else:
+        scaled = (coefficient << 4 * (position + count)) // 10**-exponent
+    return f"{scaled & (1 << 4 * count) - 1:0{count}X}"
+
+
+def trusted_hex_digits(precision: int) -> int:
+    """Get the number of hexadecimal digits covered by a decimal precision.
+
+    A few decimal digits are held back, as they may be affected by rounding.
+
+    Args:
+        precision (int): The number of significant decimal digits.
+
+    Returns:
+        int: The number of hexadecimal digits after the point determined by them.
+    """
+    return max(math.floor((precision - 5) * math.log(10, 16)) - 1, 0)
+
+
+@click.command("hex-digits", context_settings={"show_default": True})
+@click.option(
+    "--position",
+    type=click.IntRange(min=0),
+    default=0,
+    help="The position of the first digit after the hexadecimal point.",
+)
+@click.option(
+    "--count",
+    type=click.IntRange(min=1),
+    default=8,
+    help="The number of hexadecimal digits to compute.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of worker processes to compute the digits with.",
+)
+def hex_digits(position, count, jobs):
+    """Print hexadecimal digits of Pi starting at a given position."""
+    click.echo(pi_hex_digits_in_parallel(position, count, jobs))
+
+
+@click.command("spot-check", context_settings={"show_default": True})
+@click.option(
+    "-s",
+    "--sequence",
+    "sequence_names",
+    type=click.Choice(list(utils.BACKENDS["decimal"].keys()), case_sensitive=False),
+    default=["Chudnovsky", "GaussLegendre"],
+    multiple=True,
+    help="The sequence(s) whose approximations are checked.",
+)
+@utils.backend
+@click.option(
+    "--precision",
+    type=click.IntRange(min=10),
+    default=1000,
+    help="The precision to use for decimal calculations.",
+)
+@click.option(
+    "--position",
+    type=click.IntRange(min=0),
+    default=1000,
+    help="The position within the sequences whose approximation is checked.",
+)
+@click.option(
+    "--checks",
+    type=click.IntRange(min=1),
+    default=8,
+    help="The number of random hexadecimal digits to check.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=420,
+    help="The seed of the random digit positions.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of worker processes to compute the digits with.",
+)
+# pylint: disable=too-many-arguments, too-many-locals
+def spot_check(sequence_names, backend, precision, position, checks, seed, jobs):
+    """
+    Compare random hexadecimal digits of approximations with the BBP formula.
+
+    The digits are drawn from the hexadecimal digits which are determined by the
+    decimal precision, so only sequences which have converged at the given
+    position are expected to pass.
+    """
+    utils.setup_decimal_context(precision)
+
+    number_of_digits = trusted_hex_digits(precision)
+    if number_of_digits == 0:
+        raise click.UsageError("The precision does not cover any hexadecimal digits")
+    digit_positions = sorted(
+        random.Random(seed).sample(
+            range(number_of_digits), min(checks, number_of_digits)
+        )
+    )
+    with ProcessPoolExecutor(jobs) as executor:
+        expected_digits = list(
+            executor.map(pi_hex_digits, digit_positions, [1] * len(digit_positions))
+        )
+
+    failures = 0
+    for sequence_name in sequence_names:
+        approximation = utils.BACKENDS[backend][sequence_name]().at(position)
+        mismatches = [
+            (digit_position, expected_digit, digit)
+            for digit_position, expected_digit in zip(digit_positions, expected_digits)
+            if (digit := hex_digits_of(approximation, digit_position, 1))
+            != expected_digit
+        ]
+        for digit_position, expected_digit, digit in mismatches:
+            click.echo(
+                f"{sequence_name}: hexadecimal digit {digit_position} is {digit}, "
+                f"but should be {expected_digit}"
+            )
+        click.echo(
+            f"{sequence_name}: {len(digit_positions) - len(mismatches)} of "
+            f"{len(digit_positions)} hexadecimal digits match"
+        )
+        failures += len(mismatches)
+
+    if failures:
+        raise click.ClickException(f"{failures} hexadecimal digit(s) do not match")
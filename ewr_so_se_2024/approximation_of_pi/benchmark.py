@@ -0,0 +1,320 @@
+"""
+Benchmark Suite for Pi Approximation Sequences CLI
+
+This module provides a command-line interface (CLI) for benchmarking the Pi
+approximation sequences at a range of precisions. For every sequence it measures the
+throughput of `next_element()`, the latency of `at(n)` and the number of correct digits
+computed per second. For the integer backend, it also measures the latency of converting
+a scaled integer of every precision into a Decimal, and the speedup of this conversion
+over `Decimal(int)`. The results can be stored in a versioned JSON file and compared
+against a previously stored baseline, flagging every metric that regressed by more than
+a given threshold.
+
+Usage: approximation-of-pi benchmark [OPTIONS]
+
+  Benchmark the pi approximation sequences and compare them against a
+  baseline.
+
+Options:
+  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky|Spigot|Machin]
+                                  The sequence(s) to use for approximation.
+                                  [default: Leibniz, MonteCarlo,
+                                  GaussLegendre, Chudnovsky, Spigot, Machin]
+  --backend [decimal|integer]     The arithmetic backend used by the
+                                  sequences.  [default: decimal]
+  -p, --precision INTEGER RANGE   The precision(s) to benchmark the sequences
+                                  at.  [default: 50, 500, 5000; x>=1]
+  --elements INTEGER RANGE        The number of elements to advance the
+                                  sequences by when measuring the throughput.
+                                  [default: 1000; x>=1]
+  --position INTEGER RANGE        The position to measure the latency of
+                                  `at(n)` at.  [default: 1000; x>=1]
+  --repeats INTEGER RANGE         The number of repetitions of every
+                                  measurement, of which the best is kept.
+                                  [default: 3; x>=1]
+  --output FILE                   Store the results in a specified JSON file.
+  --baseline FILE                 Compare the results against a baseline JSON
+                                  file.
+  --threshold FLOAT RANGE         The relative change of a metric that counts
+                                  as a regression.  [default: 0.2; x>0]
+  --help                          Show this message and exit.
+
+Example:
+    approximation-of-pi benchmark -s Chudnovsky -p 1000 --baseline baseline.json
+"""
+
+import decimal
+import json
+import platform
+import time
+from typing import Any
+
+import click
+
+from ewr_so_se_2024.approximation_of_pi import utils
+from ewr_so_se_2024.approximation_of_pi.fixed_point import to_decimal
+
+VERSION = 1
+
+# The direction in which each metric improves
+HIGHER_IS_BETTER = {
+    "next_element_throughput": True,
+    "at_latency": False,
+    "digits_per_second": True,
+    "conversion_latency": False,
+    "conversion_speedup": True,
+}
+
+
+def benchmark_sequence(
+    sequence_class: type, precision: int, elements: int, position: int, repeats: int
+) -> dict[str, float]:
+    """Benchmark a sequence at the given precision.
+
+    Args:
+        sequence_class: The approximation sequence class.
+        precision: The precision (number of digits) for the decimal context.
+        elements: The number of elements to advance the sequence by.
+        position: The position to measure the latency of `at(n)` at.
+        repeats: The number of repetitions, of which the best is kept.
+
+    Returns:
+        The elements per second advanced by `next`, the seconds taken by `at` and
+        the correct digits per second computed by `at`.
+    """
+    next_element_time = at_time = float("inf")
+    with decimal.localcontext(prec=precision):
+        for _ in range(repeats):
+            sequence = sequence_class()
+            start = time.perf_counter()
+            for _ in range(elements):
+                next(sequence)
+            next_element_time = min(next_element_time, time.perf_counter() - start)
+
+            sequence = sequence_class()
+            start = time.perf_counter()
+            approximation = sequence.at(position)
+            at_time = min(at_time, time.perf_counter() - start)
+
+        correct_digits = max(utils.first_mismatching_digit(approximation) - 1, 0)
+
+    return {
+        "next_element_throughput": elements / next_element_time,
+        "at_latency": at_time,
+        "digits_per_second": correct_digits / at_time,
+    }
+
+
+def benchmark_conversion(precision: int, repeats: int) -> dict[str, float]:
+    """Benchmark the conversion of a scaled integer into a Decimal.
+
+    Args:
+        precision: The number of digits of the scaled integer.
+        repeats: The number of repetitions, of which the best is kept.
+
+    Returns:
+        The seconds taken by `to_decimal`, and how many times faster it is than
+        converting the scaled integer by `Decimal(int)`.
+    """
+    value = 3 * 10**precision // 7
+    conversion_time = builtin_conversion_time = float("inf")
+    with decimal.localcontext(prec=precision):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            to_decimal(value, precision)
+            conversion_time = min(conversion_time, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            decimal.Decimal(value).scaleb(-precision)
+            builtin_conversion_time = min(
+                builtin_conversion_time, time.perf_counter() - start
+            )
+    return {
+        "conversion_latency": conversion_time,
+        "conversion_speedup": builtin_conversion_time / conversion_time,
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[tuple[str, str, float, float]]:
+    """Find the metrics which regressed compared to a baseline.
+
+    Args:
+        results: The benchmark results, keyed by benchmark and metric.
+        baseline: The baseline results, keyed by benchmark and metric.
+        threshold: The relative change of a metric that counts as a regression.
+
+    Returns:
+        The benchmark, metric, baseline value and result of every regression.
+    """
+    regressions = []
+    for benchmark, metrics in results.items():
+        for metric, value in metrics.items():
+            if metric not in baseline.get(benchmark, {}):
+                continue
+            baseline_value = baseline[benchmark][metric]
+            if HIGHER_IS_BETTER[metric]:
+                regressed = value < baseline_value * (1 - threshold)
+            else:
+                regressed = value > baseline_value * (1 + threshold)
+            if regressed:
+                regressions.append((benchmark, metric, baseline_value, value))
+    return regressions
+
+
+def save_results(output_path: str, results: dict[str, dict[str, float]]):
+    """Saves benchmark results together with the store version and the platform."""
+    data: dict[str, Any] = {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(output_path, mode="w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4)
+
+
+def load_results(path: str) -> dict[str, dict[str, float]]:
+    """Loads benchmark results, checking the version of the store.
+
+    Raises:
+        ValueError: If the file is no valid store of the current version.
+    """
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    if not isinstance(data, dict):
+        raise ValueError("Invalid store: expected a JSON object")
+    if data.get("version") != VERSION:
+        raise ValueError(
+            f"Invalid version: expected {VERSION}, but got {data.get('version')}"
+        )
+    if not isinstance(data.get("results"), dict):
+        raise ValueError("Missing 'results' object in the data")
+
+    return data["results"]
+
+
+def echo_metrics(benchmark: str, results: dict[str, dict[str, float]]):
+    """Prints the metrics of a benchmark."""
+    click.echo(
+        f"{benchmark}: "
+        + ", ".join(
+            f"{metric}={value:.6g}" for metric, value in results[benchmark].items()
+        )
+    )
+
+
+@click.command("benchmark", context_settings={"show_default": True})
+@utils.sequence_names
+@utils.backend
+@click.option(
+    "-p",
+    "--precision",
+    "precisions",
+    type=click.IntRange(min=1),
+    default=[50, 500, 5000],
+    multiple=True,
+    help="The precision(s) to benchmark the sequences at.",
+)
+@click.option(
+    "--elements",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="The number of elements to advance the sequences by when measuring the "
+    "throughput.",
+)
+@click.option(
+    "--position",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="The position to measure the latency of `at(n)` at.",
+)
+@click.option(
+    "--repeats",
+    type=click.IntRange(min=1),
+    default=3,
+    help="The number of repetitions of every measurement, of which the best is kept.",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Store the results in a specified JSON file.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare the results against a baseline JSON file.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.2,
+    help="The relative change of a metric that counts as a regression.",
+)
+# pylint: disable=too-many-arguments, too-many-locals
+def main(
+    sequence_names,
+    backend,
+    precisions,
+    elements,
+    position,
+    repeats,
+    output,
+    baseline,
+    threshold,
+):
+    """Benchmark the pi approximation sequences and compare them against a baseline."""
+    # Load the baseline first, so an invalid one is reported before benchmarking
+    baseline_results = None
+    if baseline is not None:
+        try:
+            baseline_results = load_results(baseline)
+        except (OSError, ValueError) as error:
+            raise click.ClickException(
+                f"Cannot load the baseline {baseline}: {error}"
+            ) from error
+
+    utils.setup_decimal_context(max(precisions))
+
+    results = {}
+    if backend == "integer":
+        for precision in precisions:
+            results[f"integer/to_decimal/{precision}"] = benchmark_conversion(
+                precision, repeats
+            )
+            echo_metrics(f"integer/to_decimal/{precision}", results)
+    for sequence_name in sequence_names:
+        for precision in precisions:
+            benchmark = f"{backend}/{sequence_name}/{precision}"
+            results[benchmark] = benchmark_sequence(
+                utils.BACKENDS[backend][sequence_name],
+                precision,
+                elements,
+                position,
+                repeats,
+            )
+            echo_metrics(benchmark, results)
+
+    if output is not None:
+        save_results(output, results)
+
+    if baseline_results is not None:
+        regressions = find_regressions(results, baseline_results, threshold)
+        for benchmark, metric, baseline_value, value in regressions:
+            click.echo(
+                f"Regression in {benchmark}: {metric} changed from "
+                f"{baseline_value:.6g} to {value:.6g}"
+            )
+        if regressions:
+            raise click.ClickException(
+                f"{len(regressions)} metric(s) regressed by more than {threshold:.0%}"
+            )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,180 @@
+"""
+Persistent Cache of Pi Approximation Results
+
+This module provides an on-disk cache of the results computed by the analyses, so that
+re-running the same grid of samples does not compute the sequences again. Results are
+stored in a SQLite database and keyed by the kind of result, the sequence, the
+arithmetic backend, the decimal precision, the position within the sequence and the
+version of the code. The least recently used results are evicted once the cache
+holds more than a given number of entries.
+
+Classes:
+    ResultCache: A size-bounded, persistent cache of analysis results.
+
+Functions:
+    code_version():
+        Get a hash of the source code the results depend on.
+
+Attributes:
+    DEFAULT_MAX_ENTRIES (int): The default number of results kept by the cache.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from functools import cache
+from glob import glob
+from os import path
+from typing import Any, Optional
+
+from ewr_so_se_2024.approximation_of_pi.reference import cache_directory
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+@cache
+def code_version() -> str:
+    """Get a hash of the source code the results depend on.
+
+    Every module of this package contributes to the hash, so results computed by
+    a different version of the sequences or analyses are never reused.
+
+    Returns:
+        str: The hexadecimal digest of the source code.
+    """
+    digest = hashlib.sha256()
+    for module_path in sorted(glob(path.join(path.dirname(__file__), "*.py"))):
+        with open(module_path, "rb") as module_file:
+            digest.update(module_file.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """A size-bounded, persistent cache of analysis results.
+
+    A disabled cache never holds any results, so analyses can use a cache
+    regardless of whether caching was requested.
+    """
+
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+    ):
+        """Initializes the cache without touching the file system.
+
+        Args:
+            database_path (str, optional): The path of the SQLite database. Defaults
+                                           to `results.sqlite` in the cache directory.
+            max_entries (int): The number of results kept before evicting the least
+                               recently used ones.
+            enabled (bool): Whether results are looked up and stored at all.
+        """
+        self.database_path = database_path or path.join(
+            cache_directory(), "results.sqlite"
+        )
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens the database, creating its table if required."""
+        if self._connection is None:
+            os.makedirs(path.dirname(self.database_path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.database_path)
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "kind TEXT, sequence TEXT, backend TEXT, precision INTEGER, "
+                    "position INTEGER, code_version TEXT, value BLOB, "
+                    "last_used REAL, "
+                    "PRIMARY KEY (kind, sequence, backend, precision, position, "
+                    "code_version))"
+                )
+                self._connection.execute(
+                    "CREATE INDEX IF NOT EXISTS results_by_last_use "
+                    "ON results (last_used)"
+                )
+        return self._connection
+
+    def __len__(self) -> int:
+        """Returns the number of results held by the cache."""
+        if not self.enabled:
+            return 0
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    # pylint: disable=too-many-arguments
+    def get(
+        self, kind: str, sequence: str, backend: str, precision: int, position: int
+    ) -> Optional[Any]:
+        """Looks up a result, marking it as recently used.
+
+        Args:
+            kind (str): The kind of result, e.g. the analysis that computed it.
+            sequence (str): The name of the sequence.
+            backend (str): The arithmetic backend of the sequence.
+            precision (int): The decimal precision of the computation.
+            position (int): The position within the sequence.
+
+        Returns:
+            The cached result, or None if there is none.
+        """
+        if not self.enabled:
+            return None
+
+        key = (kind, sequence, backend, precision, position, code_version())
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM results WHERE kind = ? AND sequence = ? AND "
+                "backend = ? AND precision = ? AND position = ? AND code_version = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE results SET last_used = ? WHERE kind = ? AND sequence = ? "
+                "AND backend = ? AND precision = ? AND position = ? "
+                "AND code_version = ?",
+                (time.time(), *key),
+            )
+        return pickle.loads(row[0])
+
+    # pylint: disable=too-many-arguments
+    def put(
+        self,
+        kind: str,
+        sequence: str,
+        backend: str,
+        precision: int,
+        position: int,
+        value: Any,
+    ):
+        """Stores a result, evicting the least recently used ones if required.
+
+        Takes the same key arguments as `get`, followed by the result to store.
+        """
+        if not self.enabled:
+            return
+
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    sequence,
+                    backend,
+                    precision,
+                    position,
+                    code_version(),
+                    pickle.dumps(value),
+                    time.time(),
+                ),
+            )
+            connection.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
@@ -0,0 +1,200 @@
+"""
+Checkpoints of Long-Running Pi Approximation Analyses
+
+This module provides durable snapshots of the progress of an analysis, so that a run
+can be resumed after a crash instead of starting over. A checkpoint holds the state of
+every sequence (or of the object wrapping it) together with the results gathered so
+far. Checkpoints are pickled into a versioned file, which is replaced atomically, and
+are only accepted for a run with the same decimal precision and parameters.
+
+Classes:
+    Checkpoint: The progress of an analysis.
+    Checkpointer: Periodically saves a checkpoint to a file.
+
+Functions:
+    save_checkpoint(checkpoint_path, checkpoint):
+        Atomically save a checkpoint to a file.
+    load_checkpoint(checkpoint_path, precision, parameters):
+        Load a checkpoint from a file, checking its compatibility with the run.
+    advance_in_chunks(sequence, position, checkpointer, chunk_size):
+        Advance a sequence to a position, saving checkpoints along the way.
+
+Attributes:
+    CHECKPOINT_VERSION (int): The version of the checkpoint file format.
+    CHUNK_SIZE (int): The number of positions advanced between two chances to save.
+"""
+
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass, field
+from os import path
+from typing import Any, Optional
+
+CHECKPOINT_VERSION = 1
+# The number of positions a sequence is advanced by between two chances to save
+CHUNK_SIZE = 10**6
+
+
+@dataclass
+class Checkpoint:
+    """The progress of an analysis.
+
+    Attributes:
+        precision: The decimal precision of the run.
+        parameters: The parameters which determine the results of the run.
+        states: The state of the analysis of each sequence, keyed by sequence name.
+        results: The results gathered so far, keyed by sequence name.
+    """
+
+    precision: int
+    parameters: dict[str, Any]
+    states: dict[str, Any] = field(default_factory=dict)
+    results: dict[str, list] = field(default_factory=dict)
+
+
+def save_checkpoint(checkpoint_path: str, checkpoint: Checkpoint):
+    """Atomically save a checkpoint to a file.
+
+    The checkpoint is written to a temporary file next to the target, which is
+    flushed to disk before it replaces the target. A crash during the write thus
+    leaves the previous checkpoint intact.
+
+    Args:
+        checkpoint_path: The path of the checkpoint file.
+        checkpoint: The checkpoint to save.
+    """
+    directory = path.dirname(checkpoint_path) or "."
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            pickle.dump(
+                {"version": CHECKPOINT_VERSION, "checkpoint": checkpoint},
+                temporary_file,
+            )
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, checkpoint_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def load_checkpoint(
+    checkpoint_path: str, precision: int, parameters: dict[str, Any]
+) -> Checkpoint:
+    """Load a checkpoint from a file, checking its compatibility with the run.
+
+    Args:
+        checkpoint_path: The path of the checkpoint file.
+        precision: The decimal precision of the run.
+        parameters: The parameters which determine the results of the run.
+
+    Returns:
+        The loaded checkpoint.
+
+    Raises:
+        ValueError: If the checkpoint has a different version, or was taken by a
+                    run with a different precision or different parameters.
+    """
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        data = pickle.load(checkpoint_file)
+
+    if data.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Invalid checkpoint version: expected {CHECKPOINT_VERSION}, "
+            f"but got {data.get('version')}"
+        )
+
+    checkpoint = data["checkpoint"]
+    if checkpoint.precision != precision:
+        raise ValueError(
+            f"Incompatible checkpoint: taken with a precision of "
+            f"{checkpoint.precision}, but the run uses {precision}"
+        )
+    if checkpoint.parameters != parameters:
+        raise ValueError(
+            "Incompatible checkpoint: taken by a run with different parameters"
+        )
+
+    return checkpoint
+
+
+# pylint: disable=too-few-public-methods
+class Checkpointer:
+    """Periodically saves a checkpoint to a file.
+
+    Without a file, the checkpoint is only kept in memory, so analyses can use a
+    checkpointer regardless of whether checkpointing was requested.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        checkpoint_path: Optional[str],
+        precision: int,
+        parameters: dict[str, Any],
+        interval: float = 60.0,
+        resume: bool = False,
+    ):
+        """Initializes the checkpoint, resuming from the file if requested.
+
+        Args:
+            checkpoint_path: The path of the checkpoint file, or None.
+            precision: The decimal precision of the run.
+            parameters: The parameters which determine the results of the run.
+            interval: The minimum number of seconds between two saves.
+            resume: Whether to continue from an existing checkpoint file.
+        """
+        self.checkpoint_path = checkpoint_path
+        self.interval = interval
+        self._last_save = time.monotonic()
+
+        if resume and checkpoint_path is not None and path.exists(checkpoint_path):
+            self.checkpoint = load_checkpoint(checkpoint_path, precision, parameters)
+        else:
+            self.checkpoint = Checkpoint(precision, parameters)
+
+    def update(self, force: bool = False):
+        """Saves the checkpoint if the interval has elapsed since the last save.
+
+        Args:
+            force: Whether to save the checkpoint regardless of the interval.
+        """
+        if self.checkpoint_path is None:
+            return
+
+        now = time.monotonic()
+        if force or now - self._last_save >= self.interval:
+            save_checkpoint(self.checkpoint_path, self.checkpoint)
+            self._last_save = now
+
+
+def advance_in_chunks(
+    sequence: Any,
+    position: int,
+    checkpointer: Optional[Checkpointer],
+    chunk_size: int = CHUNK_SIZE,
+) -> Any:
+    """Advance a sequence to a position, saving checkpoints along the way.
+
+    Instead of a single call to `at`, the sequence is advanced by at most
+    `chunk_size` positions at a time, and the checkpointer gets the chance to save
+    the progress after every chunk. A run resumed from such a checkpoint simply
+    advances the sequence further from where it was saved.
+
+    Args:
+        sequence: The approximation sequence to advance.
+        position: The position to advance the sequence to.
+        checkpointer: The checkpointer of the run, or None.
+        chunk_size: The maximum number of positions advanced at once.
+
+    Returns:
+        The approximation of the sequence at the position.
+    """
+    while sequence.current_position + chunk_size < position:
+        sequence.at(sequence.current_position + chunk_size)
+        if checkpointer is not None:
+            checkpointer.update()
+    return sequence.at(position)
@@ -14,43 +14,158 @@ Usage: approximation-of-pi convergence [OPTIONS]
   various sequences and plots the results on a logarithmic scale.
 
 Options:
-  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky]
+  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky|Spigot|Machin]
                                   The sequence(s) to use for approximation.
                                   [default: Leibniz, MonteCarlo,
-                                  GaussLegendre, Chudnovsky]
+                                  GaussLegendre, Chudnovsky, Spigot, Machin]
   --samples INTEGER RANGE         The number of samples to take from the
                                   underlying sequence.  [default: 20; x>=1]
   --export-to FILE                Export the generated plot to a specified
                                   file.
+  --backend [decimal|integer]     The arithmetic backend used by the
+                                  sequences.  [default: decimal]
   --precision INTEGER RANGE       The precision to use for decimal
                                   calculations.  [default: 50; x>=1]
   --stop INTEGER RANGE            The maximum exponent for the logarithmic
                                   scale of the sequence positions.  [default:
                                   4; 1<=x<=12]
+  --jobs INTEGER RANGE            The number of worker processes to calculate
+                                  the convergence with.  [default: 1; x>=1]
+  --workers INTEGER RANGE         The number of worker processes used by `at`
+                                  within a single sequence (MonteCarlo and
+                                  Machin).  [default: 1; x>=1]
+  --checkpoint FILE               Periodically save the progress of the run to
+                                  a specified file.
+  --resume / --no-resume          Continue the run from its checkpoint file,
+                                  if it exists.  [default: no-resume]
+  --checkpoint-interval FLOAT RANGE
+                                  The minimum number of seconds between two
+                                  checkpoints.  [default: 60.0; x>=0]
+  --cache / --no-cache            Reuse the results cached by earlier runs and
+                                  cache the new ones.  [default: no-cache]
   --help                          Show this message and exit.
 
 
 Example:
     approximation-of-pi convergence -s Leibniz -s MonteCarlo --precision 100 --stop 5
+    approximation-of-pi convergence -s Leibniz --stop 10 --checkpoint leibniz.ckpt --resume
+    approximation-of-pi convergence -s MonteCarlo --stop 10 --workers 4
 """
 
+import decimal
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import chain
+
 import click
 from matplotlib import pyplot as plt
 from numpy import logspace
 from tqdm import tqdm
 
 from ewr_so_se_2024.approximation_of_pi import utils
-from ewr_so_se_2024.approximation_of_pi.sequences import APPROXIMATION_SEQUENCES
+from ewr_so_se_2024.approximation_of_pi.cache import ResultCache
+from ewr_so_se_2024.approximation_of_pi.checkpoint import advance_in_chunks
+
+
+# pylint: disable=too-many-arguments
+def calculate_first_mismatches(
+    sequence,
+    sample_points,
+    sequence_name,
+    first_mismatches=None,
+    checkpointer=None,
+    result_cache=None,
+    backend="decimal",
+):
+    """Calculate the first mismatches for the given sequence and sample points.
+
+    The first mismatches are appended to `first_mismatches`, skipping the sample
+    points which already have a result in it. Sample points with a result in the
+    result cache are not computed at all. The sequence is advanced in chunks of
+    positions, after every one of which the checkpointer gets the chance to save
+    the progress.
+    """
+    first_mismatches = [] if first_mismatches is None else first_mismatches
+    precision = decimal.getcontext().prec
+    for k in tqdm(
+        sample_points[len(first_mismatches) :],
+        desc=f"Calculating convergence of {sequence_name} sequence",
+        initial=len(first_mismatches),
+        total=len(sample_points),
+    ):
+        result = None
+        if result_cache is not None:
+            result = result_cache.get(
+                "convergence", sequence_name, backend, precision, k
+            )
+        if result is None:
+            approximation = advance_in_chunks(sequence, k, checkpointer)
+            result = (approximation, utils.first_mismatching_digit(approximation))
+            if result_cache is not None:
+                result_cache.put(
+                    "convergence", sequence_name, backend, precision, k, result
+                )
+
+        first_mismatches.append(result[1])
+        if checkpointer is not None:
+            checkpointer.update()
+    return first_mismatches
+
+
+def calculate_approximation_at(sequence_class, sample_point):
+    """Calculate the approximation of a new sequence at the given sample point."""
+    return sequence_class().at(sample_point)
+
+
+def calculate_approximations_of(sequence_class, sample_points):
+    """Calculate the approximations of a new sequence at the given sample points."""
+    sequence = sequence_class()
+    return [sequence.at(k) for k in sample_points]
+
 
+def calculate_approximations_in_parallel(
+    sequence_classes, sample_points, precision, jobs
+):
+    """Calculate the approximations of multiple sequences using a process pool.
+
+    Every sequence is processed by a worker of its own. The sample points of
+    sequences which support random access are spread over the workers as well.
+    Each worker sets up its decimal context before processing any sequence.
+
+    Returns:
+        A list with the approximations of each sequence, in the given order.
+    """
+    with ProcessPoolExecutor(
+        jobs, initializer=utils.setup_decimal_context, initargs=(precision,)
+    ) as executor:
+        futures = [
+            (
+                [
+                    executor.submit(calculate_approximation_at, sequence_class, k)
+                    for k in sample_points
+                ]
+                if sequence_class.supports_random_access
+                else [
+                    executor.submit(
+                        calculate_approximations_of, sequence_class, sample_points
+                    )
+                ]
+            )
+            for sequence_class in sequence_classes
+        ]
+        for _ in tqdm(
+            as_completed(chain.from_iterable(futures)),
+            total=sum(map(len, futures)),
+            desc="Calculating convergence of sequences",
+        ):
+            pass
 
-def calculate_first_mismatches(sequence, sample_points, sequence_name):
-    """Calculate the first mismatches for the given sequence and sample points."""
     return [
-        utils.find_first_mismatch(sequence.at(k).as_tuple()[1], utils.PI.as_tuple()[1])
-        for k in tqdm(
-            sample_points,
-            desc=f"Calculating convergence of {sequence_name} sequence",
+        (
+            [future.result() for future in sequence_futures]
+            if sequence_class.supports_random_access
+            else sequence_futures[0].result()
         )
+        for sequence_class, sequence_futures in zip(sequence_classes, futures)
     ]
 
 
@@ -58,6 +173,7 @@ def calculate_first_mismatches(sequence, sample_points, sequence_name):
 @utils.sequence_names
 @utils.samples
 @utils.export_to
+@utils.backend
 @click.option(
     "--precision",
     type=click.IntRange(min=1),
@@ -70,31 +186,123 @@ def calculate_first_mismatches(sequence, sample_points, sequence_name):
     default=4,
     help="The maximum exponent for the logarithmic scale of the sequence positions.",
 )
-def main(sequence_names, precision, stop, number_of_samples, export_to):
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of worker processes to calculate the convergence with.",
+)
+@utils.workers
+@utils.checkpoint_path
+@utils.resume
+@utils.checkpoint_interval
+@utils.use_cache
+# pylint: disable=too-many-arguments, too-many-locals
+def main(
+    sequence_names,
+    backend,
+    precision,
+    stop,
+    jobs,
+    workers,
+    checkpoint_path,
+    resume,
+    checkpoint_interval,
+    use_cache,
+    number_of_samples,
+    export_to,
+):
     """
     Perform a convergence analysis of Pi approximation methods.
 
     This script calculates the number of correctly approximated digits of Pi
     for various sequences and plots the results on a logarithmic scale.
     """
+    if jobs > 1 and checkpoint_path is not None:
+        raise click.UsageError("--checkpoint cannot be combined with --jobs")
+    if jobs > 1 and workers > 1:
+        raise click.UsageError("--workers cannot be combined with --jobs")
+
     utils.setup_decimal_context(precision)
 
-    sample_points = logspace(0, stop, num=number_of_samples, dtype=int)
+    sample_points = logspace(0, stop, num=number_of_samples, dtype=int).tolist()
 
     plt.figure(figsize=(10, 6))
 
-    for sequence_name in tqdm(sequence_names, desc="Processing sequences"):
-        sequence = APPROXIMATION_SEQUENCES[sequence_name]()
+    result_cache = ResultCache(enabled=use_cache)
 
-        first_mismatches = calculate_first_mismatches(
-            sequence, sample_points, sequence_name
+    if jobs > 1:
+        all_results = {
+            sequence_name: [
+                result_cache.get("convergence", sequence_name, backend, precision, k)
+                for k in sample_points
+            ]
+            for sequence_name in sequence_names
+        }
+        # Only sequences with a missing sample point are calculated again
+        uncached_sequence_names = [
+            sequence_name
+            for sequence_name, results in all_results.items()
+            if None in results
+        ]
+        all_approximations = calculate_approximations_in_parallel(
+            [utils.BACKENDS[backend][name] for name in uncached_sequence_names],
+            sample_points,
+            precision,
+            jobs,
         )
+        for sequence_name, approximations in zip(
+            uncached_sequence_names, all_approximations
+        ):
+            all_results[sequence_name] = [
+                (approximation, utils.first_mismatching_digit(approximation))
+                for approximation in approximations
+            ]
+            for k, result in zip(sample_points, all_results[sequence_name]):
+                result_cache.put(
+                    "convergence", sequence_name, backend, precision, k, result
+                )
+        all_first_mismatches = [
+            [first_mismatch for _, first_mismatch in all_results[sequence_name]]
+            for sequence_name in sequence_names
+        ]
+    else:
+        checkpointer = utils.create_checkpointer(
+            checkpoint_path,
+            precision,
+            {
+                "command": "convergence",
+                "backend": backend,
+                "sample_points": sample_points,
+            },
+            checkpoint_interval,
+            resume,
+        )
+        checkpoint = checkpointer.checkpoint
+        all_first_mismatches = []
+        for sequence_name in tqdm(sequence_names, desc="Processing sequences"):
+            if sequence_name not in checkpoint.states:
+                checkpoint.states[sequence_name] = utils.create_sequence(
+                    backend, sequence_name, workers
+                )
+                checkpoint.results[sequence_name] = []
+            all_first_mismatches.append(
+                calculate_first_mismatches(
+                    checkpoint.states[sequence_name],
+                    sample_points,
+                    sequence_name,
+                    checkpoint.results[sequence_name],
+                    checkpointer,
+                    result_cache,
+                    backend,
+                )
+            )
+            checkpointer.update(force=True)
+
+    for sequence_name, first_mismatches in zip(sequence_names, all_first_mismatches):
         plt.loglog(
             sample_points,
-            [
-                float("+inf") if first_mismatch is None else first_mismatch[0] - 1
-                for first_mismatch in first_mismatches
-            ],
+            [first_mismatch - 1 for first_mismatch in first_mismatches],
             label=sequence_name,
             **utils.get_color_and_marker(sequence_name, number_of_samples),
         )
@@ -0,0 +1,94 @@
+"""
+Streaming the Digits of Pi CLI
+
+This module provides a command-line interface (CLI) for streaming the decimal digits
+of Pi, produced one after another by the spigot algorithm. The digits are written in
+chunks as soon as each chunk is complete, so downstream consumers can process them
+while further digits are produced. Without a number of digits, the stream continues
+until it is interrupted or its consumer goes away.
+
+Usage: approximation-of-pi digits [OPTIONS]
+
+  Stream the decimal digits of Pi, starting with the leading 3.
+
+Options:
+  -n, --number-of-digits INTEGER RANGE
+                                  The number of digits to produce. Streams
+                                  digits indefinitely if omitted.  [x>=1]
+  --chunk-size INTEGER RANGE      The number of digits written at once.
+                                  [default: 1000; x>=1]
+  -o, --output FILENAME           The file to write the digits to.  [default:
+                                  -]
+  --help                          Show this message and exit.
+
+Example:
+    approximation-of-pi digits -n 100000 -o pi.txt
+    approximation-of-pi digits | head -c 1000
+"""
+
+from itertools import islice
+from typing import Iterator, Optional
+
+import click
+
+from ewr_so_se_2024.approximation_of_pi.sequences import DigitSpigot
+
+
+def pi_digit_chunks(
+    chunk_size: int, number_of_digits: Optional[int] = None
+) -> Iterator[str]:
+    """Produce the decimal digits of Pi in chunks.
+
+    Args:
+        chunk_size: The number of digits of a chunk.
+        number_of_digits: The total number of digits, or None for an endless stream.
+
+    Yields:
+        The digits of each chunk as a string, the last chunk may be shorter.
+    """
+    digits = iter(DigitSpigot())
+    if number_of_digits is not None:
+        digits = islice(digits, number_of_digits)
+
+    while True:
+        chunk = "".join(map(str, islice(digits, chunk_size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+@click.command("digits", context_settings={"show_default": True})
+@click.option(
+    "-n",
+    "--number-of-digits",
+    type=click.IntRange(min=1),
+    help="The number of digits to produce. Streams digits indefinitely if omitted.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="The number of digits written at once.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="The file to write the digits to.",
+)
+def main(number_of_digits, chunk_size, output):
+    """Stream the decimal digits of Pi, starting with the leading 3."""
+    try:
+        for chunk in pi_digit_chunks(chunk_size, number_of_digits):
+            output.write(chunk)
+            output.flush()
+        output.write("\n")
+    except BrokenPipeError:
+        # The consumer has read all of the digits it needs
+        pass
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,86 @@
+"""
+Concurrent Execution of Pi Approximation Sequences
+
+This module runs batches of jobs, each of which computes the approximation of a
+sequence at a position with a decimal precision of its own. Since every sequence
+computes in its own decimal context, jobs of different precisions do not interfere
+with each other, whether they run in threads of the same process or in separate
+worker processes.
+
+Threads avoid transferring the sequences and their approximations between processes.
+However, the decimal arithmetic of CPython holds the global interpreter lock, so
+threads only compute in parallel on builds without it. Processes run in parallel
+everywhere.
+
+Classes:
+    SequenceJob: The computation of an approximation at a position and precision.
+
+Functions:
+    run_job(job):
+        Compute the approximation of a single job.
+    run_jobs(jobs, workers, pool):
+        Compute the approximations of a batch of jobs using a pool of workers.
+
+Attributes:
+    POOLS (dict): A dictionary mapping the kinds of pools to their executor classes.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Union
+
+from ewr_so_se_2024.approximation_of_pi.sequences import ApproximationSequence
+
+POOLS: dict[str, type[Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceJob:
+    """The computation of an approximation at a position and precision.
+
+    Attributes:
+        sequence_class: The class of the sequence, which is created by the job.
+        precision: The decimal precision of the sequence.
+        position: The position within the sequence.
+    """
+
+    sequence_class: type[ApproximationSequence]
+    precision: int
+    position: int
+
+
+def run_job(job: SequenceJob) -> Union[Decimal, None]:
+    """Compute the approximation of a single job.
+
+    Args:
+        job (SequenceJob): The job to compute.
+
+    Returns:
+        Decimal: The approximation of the sequence at the position of the job.
+    """
+    return job.sequence_class.with_precision(job.precision).at(job.position)
+
+
+def run_jobs(
+    jobs: Iterable[SequenceJob], workers: int = 1, pool: str = "process"
+) -> list[Union[Decimal, None]]:
+    """Compute the approximations of a batch of jobs using a pool of workers.
+
+    Args:
+        jobs (Iterable[SequenceJob]): The jobs to compute.
+        workers (int): The number of threads or processes. A single worker computes
+                       the jobs in the calling thread.
+        pool (str): The kind of pool, one of `POOLS`.
+
+    Returns:
+        list[Decimal]: The approximations, in the order of the jobs.
+    """
+    if workers == 1:
+        return list(map(run_job, jobs))
+
+    with POOLS[pool](workers) as executor:
+        return list(executor.map(run_job, jobs))
@@ -0,0 +1,294 @@
+"""
+Fixed-Point Pi Approximation Sequences
+
+This module provides variants of the Pi approximation sequences which do all of
+their arithmetic on scaled integers (value × 10^digits, or value × 2^bits for the
+Gauss-Legendre algorithm) instead of `decimal.Decimal`.
+Python integers multiply quickly and `math.isqrt` is exact, so only the approximations
+returned by the sequences are converted to Decimals. The number of digits is taken
+from the decimal context of a sequence.
+
+Converting an integer by `Decimal(int)` takes time quadratic in its number of digits,
+which would dominate every element at high precisions. Integers are therefore split
+into halves of bits, which are converted recursively and recombined by Decimal
+multiplications, which are faster than quadratic for large numbers.
+
+Classes:
+    FixedPointLeibniz: Implements the Leibniz series on scaled integers.
+    FixedPointGaussLegendre: Implements the Gauss-Legendre algorithm on scaled integers.
+    FixedPointChudnovsky: Implements the Chudnovsky algorithm on scaled integers.
+
+Functions:
+    integer_to_decimal(value):
+        Convert an integer into a Decimal exactly.
+    to_decimal(value, digits):
+        Convert a scaled integer into a Decimal.
+    fixed_point_reciprocal_sqrt(value, bits):
+        Compute a reciprocal square root on binary scaled integers.
+
+Attributes:
+    FIXED_POINT_SEQUENCES (dict): A dictionary mapping sequence names to their classes.
+"""
+
+import decimal
+import functools
+import math
+from dataclasses import dataclass, field
+from decimal import Decimal
+from math import isqrt
+from typing import Union
+
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    ApproximationSequence,
+    Chudnovsky,
+    GaussLegendre,
+    Machin,
+    MonteCarlo,
+    Spigot,
+    in_sequence_context,
+    leibniz_fixed_point_sum,
+)
+
+# Additional digits carried by the scaled integers to absorb truncation errors
+FIXED_POINT_GUARD_DIGITS = 20
+# Additional bits kept of the differences squared by `FixedPointGaussLegendre`
+FIXED_POINT_GUARD_BITS = 64
+# Integers of up to this many bits are converted by `Decimal(int)` directly
+DIRECT_CONVERSION_BITS = 2**12
+
+
+@functools.cache
+def _power_of_two(exponent: int) -> Decimal:
+    """Returns 2^exponent as an exact Decimal."""
+    with decimal.localcontext(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX):
+        return Decimal(2) ** exponent
+
+
+def integer_to_decimal(value: int) -> Decimal:
+    """Convert an integer into a Decimal exactly, in less than quadratic time.
+
+    The integer is split into its high and low bits at a power of two, so both
+    halves are converted recursively and recombined as high * 2^bits + low. The
+    exponents are powers of two themselves, so their Decimals are cached.
+
+    Args:
+        value (int): The integer to convert.
+
+    Returns:
+        Decimal: The integer as a Decimal, with all of its digits.
+    """
+    if value.bit_length() <= DIRECT_CONVERSION_BITS:
+        return Decimal(value)
+
+    bits = 1 << ((value.bit_length() - 1).bit_length() - 1)
+    high = value >> bits
+    low = value - (high << bits)
+    with decimal.localcontext(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX):
+        return integer_to_decimal(high) * _power_of_two(bits) + integer_to_decimal(low)
+
+
+def to_decimal(value: int, digits: int) -> Decimal:
+    """Convert a scaled integer into a Decimal rounded to the current context.
+
+    Args:
+        value (int): The value multiplied by 10^digits.
+        digits (int): The number of decimal digits of the scaling factor.
+
+    Returns:
+        Decimal: The unscaled value.
+    """
+    return integer_to_decimal(value).scaleb(-digits)
+
+
+@dataclass(slots=True)
+class FixedPointLeibniz(ApproximationSequence):
+    """Leibniz series for pi approximation on scaled integers."""
+
+    supports_random_access = True
+    # The partial sums alternate around pi, approaching it from either side
+    monotone_subsequences = 2
+
+    partial_sum: int = 0
+    digits: int | None = None
+    scale: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.digits is None:
+            self.digits = self.context.prec + FIXED_POINT_GUARD_DIGITS
+        self.scale = 10**self.digits
+
+    def next_element(self) -> Decimal:
+        """Calculates the next element in the Leibniz series."""
+        term = self.scale // (2 * self.current_position + 1)
+        self.partial_sum += -term if self.current_position % 2 == 1 else term
+        return to_decimal(4 * self.partial_sum, self.digits)
+
+    @in_sequence_context
+    def at(self, position: int) -> Union[Decimal, None]:
+        """Returns the approximation at a specific position in the sequence.
+
+        Args:
+            position (int): The position in the sequence.
+
+        Returns:
+            Decimal: The approximation at the specified position, or None if
+                     the position has already been passed.
+        """
+        if self.current_position >= position:
+            return ApproximationSequence.at(self, position)
+
+        self.partial_sum += leibniz_fixed_point_sum(
+            self.current_position + 1, position + 1, self.scale
+        )
+        self._current_position = position
+        self._current_approximation = to_decimal(4 * self.partial_sum, self.digits)
+        return self.current_approximation
+
+
+def fixed_point_reciprocal_sqrt(value: int, bits: int) -> int:
+    """Computes 1 / sqrt(x) on binary scaled integers with a doubling precision.
+
+    This is `reciprocal_sqrt` on integers scaled by 2^bits: every step of Newton's
+    iteration only works at about twice the precision of the step before, and
+    only multiplies, which is faster than `math.isqrt` for large numbers.
+
+    Args:
+        value (int): The positive number x multiplied by 2^bits.
+        bits (int): The number of fractional bits of the scaled integers.
+
+    Returns:
+        int: The reciprocal square root multiplied by 2^bits, accurate up to the
+             last few bits.
+    """
+    # Every step keeps a few bits more than half of the next precision, so the
+    # errors of the steps before do not add up
+    precisions = []
+    precision = bits
+    while precision > 64:
+        precisions.append(precision)
+        precision = precision // 2 + 8
+
+    reciprocal = isqrt((1 << 3 * precision) // (value >> (bits - precision)))
+    for working_precision in reversed(precisions):
+        reciprocal <<= working_precision - precision
+        x = value >> (bits - working_precision)
+        error = (1 << working_precision) - (
+            (x * reciprocal >> working_precision) * reciprocal >> working_precision
+        )
+        reciprocal += reciprocal * error >> (working_precision + 1)
+        precision = working_precision
+    return reciprocal
+
+
+@dataclass(slots=True)
+class FixedPointGaussLegendre(GaussLegendre):
+    """Gauss-Legendre algorithm for pi approximation on scaled integers.
+
+    Only the arithmetic of `GaussLegendre` is replaced. The integers are scaled by
+    2^bits instead of a power of ten, so the rescaling after every multiplication
+    is a shift instead of a (quadratic) division. Only the approximations are
+    divided, by Decimals.
+
+    With `precision_schedule`, square roots are computed by
+    `fixed_point_reciprocal_sqrt` instead of `math.isqrt`, and the squared
+    differences of `a` only keep as many bits as reach into the precision of `t`.
+    Python integers multiply more slowly than Decimals at high precisions though,
+    so the scheduled `GaussLegendre` remains faster from about 2 * 10^4 digits on,
+    e.g. 2.5 s instead of 4.9 s for 10^5 digits.
+    """
+
+    a: int = -1
+    b: int = -1
+    t: int = -1
+    bits: int | None = None
+
+    def __post_init__(self, _b):
+        if self.bits is None:
+            self.bits = math.ceil(
+                (self.context.prec + FIXED_POINT_GUARD_DIGITS) * math.log2(10)
+            )
+        if self.a < 0:
+            self.a = 1 << self.bits
+        if _b is not None:
+            self.b = _b
+        elif self.b < 0:
+            self.b = (
+                fixed_point_reciprocal_sqrt(2 << self.bits, self.bits)
+                if self.precision_schedule
+                else isqrt(1 << (2 * self.bits - 1))
+            )
+        if self.t < 0:
+            self.t = 1 << (self.bits - 2)
+
+    def iterate(self):
+        """Performs the next iteration, without calculating its approximation."""
+        a = (self.a + self.b) >> 1
+        difference = self.a - a
+        if not self.precision_schedule:
+            self.b = isqrt(self.a * self.b)
+            self.t -= difference**2 << self.p_exponent >> self.bits
+        else:
+            product = self.a * self.b >> self.bits
+            self.b = (
+                product * fixed_point_reciprocal_sqrt(product, self.bits) >> self.bits
+            )
+            # The squared difference has 2 * length + p_exponent - bits bits left
+            length = difference.bit_length()
+            shift = max(
+                length
+                - max(2 * length + self.p_exponent - self.bits, 0)
+                - FIXED_POINT_GUARD_BITS,
+                0,
+            )
+            self.t -= (
+                (difference >> shift) ** 2 << (2 * shift + self.p_exponent) >> self.bits
+            )
+        self.p_exponent += 1
+        self.a = a
+
+    def approximation(self) -> Decimal:
+        """Calculates the approximation of the current iteration."""
+        with decimal.localcontext(
+            prec=self.context.prec + FIXED_POINT_GUARD_DIGITS, Emax=decimal.MAX_EMAX
+        ):
+            total = integer_to_decimal(self.a + self.b)
+            approximation = (
+                total
+                * total
+                / (4 * integer_to_decimal(self.t) * _power_of_two(self.bits))
+            )
+        return +approximation
+
+
+@dataclass(slots=True)
+class FixedPointChudnovsky(Chudnovsky):
+    """Chudnovsky algorithm for pi approximation on scaled integers.
+
+    The fixed-point state is shared with `Chudnovsky`, only the final division by
+    the partial sum is done on integers as well.
+    """
+
+    scaled_c: int = field(default=0, repr=False)
+
+    def __post_init__(self, _c):
+        Chudnovsky.__post_init__(self, _c)
+        if not self.scaled_c:
+            self.scaled_c = 426880 * isqrt(10005 * 10 ** (2 * self.digits))
+
+    def approximation_from_partial_sum(self) -> Decimal:
+        """Converts the fixed-point partial sum into an approximation of pi."""
+        return to_decimal(
+            self.scaled_c * 10**self.digits // self.partial_sum, self.digits
+        )
+
+
+FIXED_POINT_SEQUENCES: dict[str, type] = {
+    "Leibniz": FixedPointLeibniz,
+    # The Monte Carlo method only counts samples, so it has no fixed-point variant
+    "MonteCarlo": MonteCarlo,
+    "GaussLegendre": FixedPointGaussLegendre,
+    "Chudnovsky": FixedPointChudnovsky,
+    # The spigot algorithm and the Machin-like formulas already work on integers
+    "Spigot": Spigot,
+    "Machin": Machin,
+}
@@ -2,16 +2,28 @@
 Memory Usage Analysis of Pi Approximation Sequences CLI
 
 This module provides a command-line interface (CLI) for analyzing the memory usage 
-of various Pi approximation sequences over a range of digits of precision. It plots 
-the memory size of different sequences and can display the plot or save it to a file.
+of various Pi approximation sequences over a range of digits of precision or over a
+range of sequence positions. It plots the memory size of different sequences and can
+display the plot or save it to a file.
+
+The memory can be measured in several ways:
+
+- `pickle`: The size of the pickled sequence, a rough proxy of its retained state.
+- `deep`: The retained size of the sequence, summed over its whole object graph.
+- `tracemalloc`: The peak of the memory allocated while computing the approximation,
+  including transient values like the intermediate terms of a series.
+- `rss`: The growth of the resident set size high-water mark of the process.
+
+Unless `--in-process` is given, every sample is taken in a freshly spawned process,
+so that allocations of earlier samples do not pollute the later ones.
 
 Usage: approximation-of-pi plot-memory-usage [OPTIONS]
 
   Plot the memory usage of different Pi approximation sequences over a range
-  of digits of precision.
+  of digits of precision or sequence positions.
 
 Options:
-  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky]
+  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky|Spigot|Machin]
                                   The sequence(s) to use for approximation.
   --digits INTEGER RANGE          The maximum number of digits to approximate
                                   pi to.  [x>=1]
@@ -19,25 +31,42 @@ Options:
                                   underlying sequence.  [x>=1]
   --export-to FILE                Export the generated plot to a specified
                                   file.
+  --backend [decimal|integer]     The arithmetic backend used by the
+                                  sequences.
+  --mode [pickle|deep|tracemalloc|rss]
+                                  How the memory usage is measured.
+  --against [precision|position]  Whether to sample the memory usage against
+                                  the precision or the sequence position.
+  --max-position INTEGER RANGE    The maximum sequence position when sampling
+                                  against the position.  [x>=0]
+  --isolated / --in-process       Whether to take every sample in a freshly
+                                  spawned process.
+  --cache / --no-cache            Reuse the results cached by earlier runs and
+                                  cache the new ones.
   --help                          Show this message and exit.
 
 Example:
     approximation-of-pi plot-memory-usage -s Leibniz -s MonteCarlo --digits 100
+    approximation-of-pi plot-memory-usage -s Chudnovsky --mode tracemalloc \\
+        --against position --max-position 1000 --digits 5000
 
 """
 
+import dataclasses
 import decimal
+import multiprocessing
 import pickle
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import click
 from matplotlib import pyplot as plt
 
 from ewr_so_se_2024.approximation_of_pi import utils
-from ewr_so_se_2024.approximation_of_pi.sequences import (
-    APPROXIMATION_SEQUENCES,
-    ApproximationSequence,
-)
+from ewr_so_se_2024.approximation_of_pi.cache import ResultCache
+from ewr_so_se_2024.approximation_of_pi.sequences import ApproximationSequence
 
 # Mapping of sequences to their appropriate starting positions
 SEQUENCE_POSITIONS = {
@@ -45,11 +74,67 @@ SEQUENCE_POSITIONS = {
     "GaussLegendre": 0,
     "Chudnovsky": 0,
     "MonteCarlo": 1024,
+    "Spigot": 128,
+    "Machin": 16,
 }
 
+MEMORY_MODES = ["pickle", "deep", "tracemalloc", "rss"]
+
+
+def deep_size_of(obj: object) -> int:
+    """
+    Calculate the retained size of an object by summing over its object graph.
+
+    Args:
+        obj: The object to measure.
+
+    Returns:
+        The size of the object and all objects reachable from it in bytes.
+    """
+    seen = set()
+    pending = [obj]
+    size = 0
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, np.ndarray) and current.base is not None:
+            # Views do not account for the buffer they are looking at
+            size += current.nbytes
+        elif isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+
+        if hasattr(current, "__dict__"):
+            pending.append(vars(current))
+        elif dataclasses.is_dataclass(current):
+            # Slotted dataclasses have no instance dictionary
+            pending.extend(
+                getattr(current, field.name) for field in dataclasses.fields(current)
+            )
+    return size
+
+
+def _peak_rss() -> int:
+    """Returns the resident set size high-water mark of the process in bytes."""
+    # pylint: disable=import-outside-toplevel; (not available on all platforms)
+    import resource
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes while macOS reports bytes
+    return peak_rss if sys.platform == "darwin" else 1024 * peak_rss
+
 
 def calculate_sequence_memory_size(
-    sequence_class: type[ApproximationSequence], precision: int, position: int
+    sequence_class: type[ApproximationSequence],
+    precision: int,
+    position: int,
+    mode: str = "pickle",
 ) -> int:
     """
     Calculate the memory size of a given sequence at a specified position and precision.
@@ -58,50 +143,154 @@ def calculate_sequence_memory_size(
         sequence_class: The approximation sequence class.
         precision: The precision (number of digits) for the decimal context.
         position: The position in the sequence to evaluate.
+        mode: How the memory usage is measured, one of `MEMORY_MODES`.
 
     Returns:
         The memory size of the sequence instance in bytes.
     """
     with decimal.localcontext(prec=precision):
+        if mode == "tracemalloc":
+            tracemalloc.start()
+            try:
+                sequence_class().at(position)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        if mode == "rss":
+            peak_rss = _peak_rss()
+            sequence_class().at(position)
+            return _peak_rss() - peak_rss
+
         sequence_instance = sequence_class()
         sequence_instance.at(position)
+        if mode == "deep":
+            return deep_size_of(sequence_instance)
         # The pickled version of the object roughly has the same memory
         # footprint of the underlying type
         return len(pickle.dumps(sequence_instance))
 
 
+def calculate_isolated_sequence_memory_size(
+    sequence_class: type[ApproximationSequence],
+    precision: int,
+    position: int,
+    mode: str = "pickle",
+) -> int:
+    """
+    Calculate the memory size of a sequence in a freshly spawned process.
+
+    Takes the same arguments as `calculate_sequence_memory_size`.
+
+    Returns:
+        The memory size of the sequence instance in bytes.
+    """
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(
+            calculate_sequence_memory_size, sequence_class, precision, position, mode
+        ).result()
+
+
 @click.command("memory-usage")
 @utils.sequence_names
 @utils.digits
 @utils.samples
 @utils.export_to
-def plot_memory_usage(sequence_names, digits, number_of_samples, export_to):
+@utils.backend
+@click.option(
+    "--mode",
+    type=click.Choice(MEMORY_MODES),
+    default="pickle",
+    help="How the memory usage is measured.",
+)
+@click.option(
+    "--against",
+    type=click.Choice(["precision", "position"]),
+    default="precision",
+    help="Whether to sample the memory usage against the precision or the sequence "
+    "position.",
+)
+@click.option(
+    "--max-position",
+    type=click.IntRange(min=0),
+    default=1000,
+    help="The maximum sequence position when sampling against the position.",
+)
+@click.option(
+    "--isolated/--in-process",
+    default=True,
+    help="Whether to take every sample in a freshly spawned process.",
+)
+@utils.use_cache
+# pylint: disable=too-many-arguments, too-many-locals
+def plot_memory_usage(
+    sequence_names,
+    digits,
+    backend,
+    mode,
+    against,
+    max_position,
+    isolated,
+    use_cache,
+    number_of_samples,
+    export_to,
+):
     """
     Plot the memory usage of different Pi approximation sequences
-    over a range of digits of precision.
+    over a range of digits of precision or sequence positions.
     """
-    # Generate a range of sample points for approximation
-    precision_range = np.linspace(1, digits, min(number_of_samples, digits))
+    measure = (
+        calculate_isolated_sequence_memory_size
+        if isolated
+        else calculate_sequence_memory_size
+    )
+    result_cache = ResultCache(enabled=use_cache)
+    result_kind = f"memory-{mode}" if isolated else f"in-process-memory-{mode}"
 
     for sequence_name in sequence_names:
-        memory_sizes = [
-            calculate_sequence_memory_size(
-                APPROXIMATION_SEQUENCES[sequence_name],
-                int(precision),
-                SEQUENCE_POSITIONS[sequence_name],
+        if against == "precision":
+            # Generate a range of sample points for approximation
+            sample_points = np.linspace(1, digits, min(number_of_samples, digits))
+            arguments = [
+                (int(precision), SEQUENCE_POSITIONS[sequence_name])
+                for precision in sample_points
+            ]
+        else:
+            sample_points = np.unique(
+                np.linspace(0, max_position, number_of_samples, dtype=int)
+            )
+            arguments = [(digits, position) for position in sample_points.tolist()]
+
+        memory_sizes = []
+        for precision, position in arguments:
+            memory_size = result_cache.get(
+                result_kind, sequence_name, backend, precision, position
             )
-            for precision in precision_range
-        ]
+            if memory_size is None:
+                memory_size = measure(
+                    utils.BACKENDS[backend][sequence_name], precision, position, mode
+                )
+                result_cache.put(
+                    result_kind,
+                    sequence_name,
+                    backend,
+                    precision,
+                    position,
+                    memory_size,
+                )
+            memory_sizes.append(memory_size)
         plt.plot(
-            precision_range,
+            sample_points,
             memory_sizes,
             label=sequence_name,
             **utils.get_color_and_marker(sequence_name, number_of_samples)
         )
 
     plt.legend()
-    plt.xlabel("Digits of Precision")
-    plt.ylabel("Memory Size (bytes)")
+    plt.xlabel("Digits of Precision" if against == "precision" else "Sequence Position")
+    plt.ylabel(f"Memory Size (bytes, {mode})")
     plt.title("Memory Usage of Pi Approximation Sequences")
     plt.grid(True)
 
@@ -0,0 +1,168 @@
+"""
+High-Precision Reference Digits of Pi
+
+This module provides an on-demand store for the reference digits of Pi that the
+analyses compare their approximations against. The digits are kept on disk as packed
+binary-coded decimals (two digits per byte) and memory-mapped when first needed. The
+store is seeded with the digits bundled in the `PI` file. Whenever more digits are
+requested than are stored, they are computed once using the Chudnovsky algorithm and
+the enlarged store replaces the cached file.
+
+Classes:
+    PiDigits: A lazily loaded, self-extending store of the digits of Pi.
+
+Functions:
+    cache_directory():
+        Get the directory used for caching data on disk.
+    compute_pi_digits(number_of_digits):
+        Compute the leading digits of Pi.
+
+Attributes:
+    PI_REFERENCE (PiDigits): The store of reference digits shared by all analyses.
+"""
+
+import decimal
+import mmap
+import os
+import tempfile
+from decimal import Decimal
+from os import path
+from typing import Optional
+
+from ewr_so_se_2024.approximation_of_pi.fixed_point import integer_to_decimal
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    chudnovsky_binary_split,
+    reciprocal_sqrt,
+)
+
+# Path of the digits of Pi which are bundled with this package
+BUNDLED_PI_PATH = path.join(path.dirname(__file__), "PI")
+
+
+def cache_directory() -> str:
+    """Get the directory used for caching data on disk.
+
+    Returns:
+        str: The `ewr_so_se_2024` directory within `$XDG_CACHE_HOME` (or `~/.cache`).
+    """
+    return path.join(
+        os.environ.get("XDG_CACHE_HOME") or path.expanduser(path.join("~", ".cache")),
+        "ewr_so_se_2024",
+    )
+
+
+def compute_pi_digits(number_of_digits: int) -> bytes:
+    """Compute the leading digits of Pi using the Chudnovsky algorithm.
+
+    Args:
+        number_of_digits (int): The number of digits to compute, including the leading 3.
+
+    Returns:
+        bytes: The digits of Pi as an ASCII byte string.
+    """
+    # Ten guard digits protect the requested digits from the rounding errors
+    precision = number_of_digits + 10
+    _, q, t = chudnovsky_binary_split(0, precision // 14 + 2)
+
+    # Integer square roots, divisions and conversions into strings take quadratic
+    # time, while the decimal module multiplies and divides large numbers faster
+    with decimal.localcontext(prec=precision, Emax=decimal.MAX_EMAX):
+        sqrt_10005 = 10005 * reciprocal_sqrt(Decimal(10005), precision)
+        pi = 426880 * sqrt_10005 * integer_to_decimal(q) / integer_to_decimal(t)
+    return str(pi).replace(".", "")[:number_of_digits].encode("ascii")
+
+
+class PiDigits:
+    """A lazily loaded, self-extending store of the digits of Pi.
+
+    The store is a file of packed binary-coded decimals, which always holds an even
+    number of digits. It is memory-mapped the first time digits are requested.
+    """
+
+    def __init__(self, store_path: Optional[str] = None):
+        """Initializes the store without touching the file system.
+
+        Args:
+            store_path (str, optional): The path of the packed digits. Defaults to
+                                        `pi-digits.bcd` in the cache directory.
+        """
+        self.store_path = store_path or path.join(cache_directory(), "pi-digits.bcd")
+        self._mapping: Optional[mmap.mmap] = None
+        # The longest prefix of digits unpacked so far
+        self._unpacked = b""
+
+    def __len__(self) -> int:
+        """Returns the number of digits held by the store."""
+        return 2 * len(self._open())
+
+    def _open(self) -> mmap.mmap:
+        """Memory-maps the store, seeding it with the bundled digits if required."""
+        if self._mapping is None:
+            if not path.exists(self.store_path):
+                with open(BUNDLED_PI_PATH, encoding="utf-8") as pi_file:
+                    bundled_digits = "".join(
+                        character for character in pi_file.read() if character.isdigit()
+                    )
+                # The last bundled digit is rounded, so it is not a digit of Pi
+                self._write(bundled_digits[:-1].encode("ascii"))
+
+            with open(self.store_path, "rb") as store_file:
+                self._mapping = mmap.mmap(
+                    store_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        return self._mapping
+
+    def _write(self, pi_digits: bytes):
+        """Atomically replaces the store with the given digits."""
+        packed_digits = bytes.fromhex(
+            pi_digits[: len(pi_digits) // 2 * 2].decode("ascii")
+        )
+        os.makedirs(path.dirname(self.store_path) or ".", exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=path.dirname(self.store_path) or "."
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(packed_digits)
+            os.replace(temporary_path, self.store_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def ensure(self, number_of_digits: int):
+        """Makes sure that the store holds at least the given number of digits.
+
+        The store grows at least by a factor of two, so that slowly increasing
+        requests do not compute Pi over and over again.
+
+        Args:
+            number_of_digits (int): The number of digits required.
+        """
+        stored_digits = len(self)
+        if stored_digits >= number_of_digits:
+            return
+
+        pi_digits = compute_pi_digits(max(number_of_digits, 2 * stored_digits) + 1)
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+        self._write(pi_digits)
+
+    def digits(self, number_of_digits: int) -> bytes:
+        """Get the leading digits of Pi.
+
+        Args:
+            number_of_digits (int): The number of digits, including the leading 3.
+
+        Returns:
+            bytes: The digits of Pi as an ASCII byte string.
+        """
+        if len(self._unpacked) < number_of_digits:
+            self.ensure(number_of_digits)
+            # Unpack geometrically more digits for slowly increasing requests
+            packed_length = max(number_of_digits + 1, 2 * len(self._unpacked)) // 2
+            self._unpacked = self._open()[:packed_length].hex().encode("ascii")
+        return self._unpacked[:number_of_digits]
+
+
+PI_REFERENCE = PiDigits()
@@ -13,21 +13,47 @@ Usage: approximation-of-pi runtime [OPTIONS]
 Options:
   --samples INTEGER RANGE         The number of samples to take from the
                                   underlying sequence.  [default: 20; x>=1]
-  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky]
+  -s, --sequence [Leibniz|MonteCarlo|GaussLegendre|Chudnovsky|Spigot|Machin]
                                   The sequence(s) to use for approximation.
                                   [default: Leibniz, MonteCarlo,
-                                  GaussLegendre, Chudnovsky]
+                                  GaussLegendre, Chudnovsky, Spigot, Machin]
   --export-to FILE                Export the generated plot to a specified
                                   file.
   --digits INTEGER RANGE          The maximum number of digits to approximate
                                   pi to.  [default: 5; x>=1]
+  --backend [decimal|integer]     The arithmetic backend used by the
+                                  sequences.  [default: decimal]
+  --search / --no-search          Search for the positions reaching the digits
+                                  instead of checking every position. Not
+                                  supported by the MonteCarlo sequence.
+                                  [default: no-search]
+  --workers INTEGER RANGE         The number of worker processes used by `at`
+                                  within a single sequence (MonteCarlo and
+                                  Machin).  [default: 1; x>=1]
+  --checkpoint FILE               Periodically save the progress of the run to
+                                  a specified file.
+  --resume / --no-resume          Continue the run from its checkpoint file,
+                                  if it exists.  [default: no-resume]
+  --checkpoint-interval FLOAT RANGE
+                                  The minimum number of seconds between two
+                                  checkpoints.  [default: 60.0; x>=0]
+  --cache / --no-cache            Reuse the results cached by earlier runs and
+                                  cache the new ones.  [default: no-cache]
   --help                          Show this message and exit.
 
+With --search, the sequences are advanced by `at`, which evaluates the series of
+the Machin sequence in parallel if --workers is given.
+
 Example:
     approximation-of-pi runtime -s Leibniz -s MonteCarlo --digits 100
+    approximation-of-pi runtime -s Machin --digits 10000 --search --workers 2
 """
 
 from dataclasses import dataclass
+from typing import Optional
+import copy
+import functools
+import hashlib
 import time
 
 from tqdm import tqdm
@@ -35,81 +61,288 @@ import click
 import matplotlib.pyplot as plt
 import numpy as np
 
-from ewr_so_se_2024.approximation_of_pi.sequences import (
-    APPROXIMATION_SEQUENCES,
-    ApproximationSequence,
-)
+from ewr_so_se_2024.approximation_of_pi.sequences import ApproximationSequence
 from ewr_so_se_2024.approximation_of_pi import utils
+from ewr_so_se_2024.approximation_of_pi.cache import ResultCache
+from ewr_so_se_2024.approximation_of_pi.checkpoint import Checkpointer
 
 
 @dataclass
 class RuntimeAnalysis:
-    """Class to analyze the runtime of a pi approximation sequence."""
+    """Class to analyze the runtime of a pi approximation sequence.
+
+    The time spent advancing the sequence is recorded in `total_time`, while the
+    time spent checking the digits of its approximations (and, when searching,
+    copying and re-advancing checkpoints) is recorded in `verification_time`.
+    """
 
     sequence: ApproximationSequence
     total_time: float = 0
+    verification_time: float = 0
+
+    def _has_correct_digits(self, sequence: ApproximationSequence, n: int) -> bool:
+        """Checks whether the approximation of `sequence` has n correct digits."""
+        if sequence.current_position <= 0:
+            return False
+        return utils.first_mismatching_digit(sequence.current_approximation) >= n
 
-    def approximation_up_to(self, n: int) -> float:
+    def approximation_up_to(
+        self, n: int, checkpointer: Optional[Checkpointer] = None
+    ) -> float:
         """Approximate pi up to n decimal places and record the time taken.
 
         Args:
             n (int): The number of decimal places to approximate pi to.
+            checkpointer (Checkpointer, optional): The checkpointer of the run,
+                which gets the chance to save the progress after every element.
 
         Returns:
             float: The total time taken to achieve the approximation in nanoseconds.
         """
-        while (
-            self.sequence.current_position <= 0
-            or (
-                first_mismatch := utils.find_first_mismatch(
-                    self.sequence.current_approximation.as_tuple()[1],
-                    utils.PI.as_tuple()[1],
-                )
-            )
-            and first_mismatch[0] < n
-        ):
+        while True:
+            verification_start = time.time_ns()
+            has_correct_digits = self._has_correct_digits(self.sequence, n)
+            self.verification_time += time.time_ns() - verification_start
+            if has_correct_digits:
+                break
+
             operation_start = time.time_ns()
             next(self.sequence)
             self.total_time += time.time_ns() - operation_start
+            if checkpointer is not None:
+                checkpointer.update()
 
         return self.total_time
 
+    def search_approximation_up_to(self, n: int) -> float:
+        """Approximate pi up to n decimal places by searching for the position.
+
+        The number of correct digits of a sequence only grows monotonically on
+        each of its `monotone_subsequences`, e.g. on the even and on the odd
+        positions of a series alternating around pi. The first position with n
+        correct digits is searched on each of these subsequences by
+        `_search_subsequence`, and the sequence continues from the earliest one.
+        The digits are only checked once per step, instead of after every element.
+
+        Args:
+            n (int): The number of decimal places to approximate pi to.
+
+        Returns:
+            float: The total time taken to advance the sequence to the found
+                   position in nanoseconds, excluding the verification overhead.
+
+        Raises:
+            ValueError: If the sequence has no monotone subsequences to search.
+        """
+        period = self.sequence.monotone_subsequences
+        if period is None:
+            raise ValueError(
+                f"The correct digits of {type(self.sequence).__name__} do not grow "
+                "monotonically, so its positions cannot be searched"
+            )
+
+        search_start = time.time_ns()
+        start_time = self.total_time
+        self.sequence, self.total_time = min(
+            (
+                self._search_subsequence(
+                    n, self.sequence.current_position + offset, period
+                )
+                for offset in range(period)
+            ),
+            key=lambda candidate: candidate[0].current_position,
+        )
+        self.verification_time += (time.time_ns() - search_start) - (
+            self.total_time - start_time
+        )
+        return self.total_time
+
+    def _search_subsequence(
+        self, n: int, first_position: int, period: int
+    ) -> tuple[ApproximationSequence, float]:
+        """Search the first position with n correct digits in a subsequence.
+
+        Starting from the current position, the sequence is advanced to the
+        positions `first_position + index * period` in doubling steps of the index
+        until its approximation has n correct digits, keeping a copy of its state
+        before every step as a checkpoint. Between the last two checkpoints the
+        index is then bisected, advancing copies of the lower checkpoint.
+
+        Returns:
+            tuple: A copy of the sequence advanced to the found position and the
+                   total time taken to advance it there in nanoseconds.
+        """
+
+        def advance(checkpoint, index):
+            sequence, sequence_time = checkpoint
+            position = first_position + index * period
+            if position == sequence.current_position:
+                return checkpoint
+            sequence = copy.deepcopy(sequence)
+            operation_start = time.time_ns()
+            sequence.at(position)
+            return sequence, sequence_time + time.time_ns() - operation_start
+
+        # Exponential search, `lower` being the last checkpoint without n correct
+        # digits, which is the current position before the first step
+        lower, lower_index = (self.sequence, self.total_time), -1
+        upper, upper_index, step = advance(lower, 0), 0, 1
+        while not self._has_correct_digits(upper[0], n):
+            lower, lower_index = upper, upper_index
+            upper_index += step
+            upper = advance(lower, upper_index)
+            step *= 2
+
+        # Binary search between the last two checkpoints
+        while upper_index - lower_index > 1:
+            middle_index = (lower_index + upper_index) // 2
+            middle = advance(lower, middle_index)
+            if self._has_correct_digits(middle[0], n):
+                upper, upper_index = middle, middle_index
+            else:
+                lower, lower_index = middle, middle_index
+
+        return upper
+
+
+def runtime_result_kind(search: bool, sample_points: list, workers: int) -> str:
+    """Get the kind under which the runtime of the samples is cached.
+
+    Advancing the sequence element by element takes the same time to reach a
+    number of digits, no matter which numbers of digits were sampled before. A
+    search continues from the position found for the previous sample, though, so
+    its timings are only reused for the same sample points and worker processes.
+
+    Args:
+        search (bool): Whether the positions are searched.
+        sample_points (list): The numbers of digits sampled.
+        workers (int): The number of worker processes used by the sequences.
+
+    Returns:
+        str: The kind of the cached runtime results.
+    """
+    if not search:
+        return "runtime"
+    grid = hashlib.sha256(repr((sample_points, workers)).encode("ascii"))
+    return f"search-runtime-{grid.hexdigest()[:16]}"
+
 
 @click.command("runtime", context_settings={"show_default": True})
 @utils.samples
 @utils.sequence_names
 @utils.export_to
 @utils.digits
-# pylint: disable=too-many-locals
-def main(sequence_names, digits, number_of_samples, export_to):
+@utils.backend
+@click.option(
+    "--search/--no-search",
+    default=False,
+    help="Search for the positions reaching the digits instead of checking every "
+    "position. Not supported by the MonteCarlo sequence.",
+)
+@utils.workers
+@utils.checkpoint_path
+@utils.resume
+@utils.checkpoint_interval
+@utils.use_cache
+# pylint: disable=too-many-locals, too-many-arguments
+def main(
+    sequence_names,
+    digits,
+    backend,
+    search,
+    workers,
+    checkpoint_path,
+    resume,
+    checkpoint_interval,
+    use_cache,
+    number_of_samples,
+    export_to,
+):
     """Perform runtime analysis on pi approximation sequences."""
+    unsearchable_sequence_names = [
+        sequence_name
+        for sequence_name in sequence_names
+        if utils.BACKENDS[backend][sequence_name].monotone_subsequences is None
+    ]
+    if search and unsearchable_sequence_names:
+        raise click.UsageError(
+            "--search requires sequences whose correct digits grow monotonically, "
+            f"which is not the case for: {', '.join(unsearchable_sequence_names)}"
+        )
+    # Without searching, the sequences are advanced one element at a time
+    if workers > 1 and not search:
+        raise click.UsageError("--workers requires --search")
+
     # Set precision for Decimal calculations
     utils.setup_decimal_context(digits + 4)
 
     # Generate a range of sample points for approximation
     sample_points = np.linspace(1, digits, min(number_of_samples, digits), dtype=int)
 
+    checkpointer = utils.create_checkpointer(
+        checkpoint_path,
+        digits + 4,
+        {
+            "command": "runtime",
+            "backend": backend,
+            "search": search,
+            "sample_points": sample_points.tolist(),
+        },
+        checkpoint_interval,
+        resume,
+    )
+    checkpoint = checkpointer.checkpoint
+    result_cache = ResultCache(enabled=use_cache)
+    result_kind = runtime_result_kind(search, sample_points.tolist(), workers)
+
     fig, (computation_times_ax, average_position_deltas_ax) = plt.subplots(
         1, 2, figsize=(12, 6)
     )
     fig.suptitle("Runtime and Average Digit Time Analysis")
 
     for sequence_name in tqdm(sequence_names, desc="Sampling sequences"):
-        # Create a runtime analysis instance for each sequence
-        sequence = APPROXIMATION_SEQUENCES[sequence_name]()
-        runtime_analysis = RuntimeAnalysis(sequence)
-
-        computation_time, average_digit_time = zip(
-            *[
-                (
-                    computation_time := runtime_analysis.approximation_up_to(digits)
-                    / 10**6,
-                    computation_time / digits,
-                )
-                for digits in tqdm(
-                    sample_points, desc=f"Sampling the {sequence_name} sequence"
+        # Create a runtime analysis instance for each sequence, unless resumed
+        if sequence_name not in checkpoint.states:
+            sequence = utils.create_sequence(backend, sequence_name, workers)
+            checkpoint.states[sequence_name] = RuntimeAnalysis(sequence)
+            checkpoint.results[sequence_name] = []
+        runtime_analysis = checkpoint.states[sequence_name]
+        timings = checkpoint.results[sequence_name]
+        approximation_up_to = (
+            runtime_analysis.search_approximation_up_to
+            if search
+            else functools.partial(
+                runtime_analysis.approximation_up_to, checkpointer=checkpointer
+            )
+        )
+
+        for number_of_digits in tqdm(
+            sample_points[len(timings) :],
+            desc=f"Sampling the {sequence_name} sequence",
+            initial=len(timings),
+            total=len(sample_points),
+        ):
+            computation_time = result_cache.get(
+                result_kind, sequence_name, backend, digits + 4, number_of_digits
+            )
+            if computation_time is None:
+                computation_time = approximation_up_to(number_of_digits) / 10**6
+                result_cache.put(
+                    result_kind,
+                    sequence_name,
+                    backend,
+                    digits + 4,
+                    number_of_digits,
+                    computation_time,
                 )
-            ]
+            timings.append((computation_time, computation_time / number_of_digits))
+            checkpointer.update()
+        checkpointer.update(force=True)
+
+        computation_time, average_digit_time = zip(*timings)
+        tqdm.write(
+            f"{sequence_name}: {runtime_analysis.total_time / 10**6:.3f} ms computation, "
+            f"{runtime_analysis.verification_time / 10**6:.3f} ms verification"
         )
 
         # Plot runtime analysis for the sequence
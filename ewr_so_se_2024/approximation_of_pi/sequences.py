@@ -11,31 +11,128 @@ Classes:
     MonteCarlo: Implements the Monte Carlo method for Pi approximation.
     GaussLegendre: Implements the Gauss-Legendre algorithm for Pi approximation.
     Chudnovsky: Implements the Chudnovsky algorithm for Pi approximation.
+    Machin: Implements Machin-like arctangent formulas for Pi approximation.
+    DigitSpigot: Streams the decimal digits of Pi using Gibbons' spigot algorithm.
+    Spigot: Implements the spigot algorithm for Pi approximation.
+
+Functions:
+    in_sequence_context(method):
+        Run a method of a sequence in the decimal context of the sequence.
+    leibniz_fixed_point_sum(start, stop, scale):
+        Sum a range of Leibniz terms in fixed-point arithmetic.
+    draw_monte_carlo_batch(seed, batch_index, batch_size):
+        Draw a batch of Monte Carlo samples from the stream of a seed.
+    count_monte_carlo_hits(seed, first_batch, stop_batch, batch_size):
+        Count the samples inside of the unit circle in a range of batches.
+    process_pool(workers):
+        Get the process pool of the given size shared by all sequences.
+    reciprocal_sqrt(x, precision):
+        Compute a reciprocal square root with a doubling working precision.
+    chudnovsky_binary_split(start, stop):
+        Evaluate a range of Chudnovsky terms using binary splitting.
+    arccot_fixed_point_sum(x, start, stop, power):
+        Sum a range of terms of the series of arctan(1/x) in fixed-point arithmetic.
 
 Attributes:
+    MACHIN_FORMULAS (dict): A dictionary mapping Machin-like formulas to their terms.
     APPROXIMATION_SEQUENCES (dict): A dictionary mapping sequence names to their classes.
 """
 
 import decimal
-import random
+import functools
 from abc import ABC, abstractmethod
 from collections import abc
-from dataclasses import InitVar, dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import InitVar, dataclass, field
 from decimal import Decimal
-from math import factorial, sqrt
-from typing import Iterator, Union
+from itertools import repeat
+from operator import mul
+from typing import Callable, ClassVar, Iterator, Union
 
 import click
+import numpy as np
 
 RealValuedSequence = abc.Iterator[Decimal]
 
 
-@dataclass
+def in_sequence_context(method: Callable) -> Callable:
+    """Decorates a method of a sequence to run in the decimal context of the sequence.
+
+    The context of the sequence is only swapped in if it is not the current one
+    already, so methods called from within another method of the sequence run
+    without any overhead. Like any other context, the context of the sequence
+    collects the flags raised by its own calculations.
+
+    Args:
+        method (Callable): The method, taking the sequence as its first argument.
+
+    Returns:
+        Callable: The method, with the context of the sequence as the current one.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        previous_context = decimal.getcontext()
+        if previous_context is self.context:
+            return method(self, *args, **kwargs)
+
+        decimal.setcontext(self.context)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            decimal.setcontext(previous_context)
+
+    return wrapper
+
+
+def _copy_current_context() -> decimal.Context:
+    """Copies the current decimal context, without the flags it has raised so far."""
+    context = decimal.getcontext().copy()
+    context.clear_flags()
+    return context
+
+
+@dataclass(slots=True)
 class ApproximationSequence(ABC, RealValuedSequence):
-    """Abstract base class for a sequence that approximates the value of pi."""
+    """Abstract base class for a sequence that approximates the value of pi.
+
+    The sequences are slotted dataclasses, so instances carry no `__dict__`. Since
+    zero-argument `super()` does not work in slotted dataclasses, overriding methods
+    call the base class implementation explicitly.
+
+    Every sequence owns a decimal context, by default a copy of the context that is
+    current when the sequence is created. The sequence only computes in its own
+    context, so sequences of different precisions can be advanced side by side,
+    also from different threads. Overrides of `at` are therefore decorated with
+    `in_sequence_context`.
+    """
+
+    # Whether `at` reaches any position without walking through the ones before it
+    supports_random_access: ClassVar[bool] = False
+    # The number of interleaved subsequences (of the positions with the same
+    # remainder) on which the number of correct digits never decreases, apart from
+    # the last digits of the precision, or None if there are no such subsequences
+    monotone_subsequences: ClassVar[int | None] = None
 
     _current_position: int = -1
     _current_approximation: Decimal = Decimal("nan")
+    context: decimal.Context = field(
+        default_factory=_copy_current_context, repr=False, compare=False
+    )
+
+    @classmethod
+    def with_precision(cls, precision: int, **kwargs) -> "ApproximationSequence":
+        """Creates a sequence which computes with the given decimal precision.
+
+        Args:
+            precision (int): The number of significant digits of the sequence.
+            **kwargs: The remaining arguments of the sequence.
+
+        Returns:
+            ApproximationSequence: The new sequence.
+        """
+        with decimal.localcontext(prec=precision):
+            return cls(**kwargs)
 
     @property
     def current_position(self) -> int:
@@ -52,15 +149,29 @@ class ApproximationSequence(ABC, RealValuedSequence):
         return self
 
     def __next__(self) -> Decimal:
-        """Advances to the next element in the sequence and returns it."""
+        """Advances to the next element in the sequence and returns it.
+
+        Every element is timed by the runtime analysis, so unlike `at` this is not
+        decorated with `in_sequence_context`, but swaps in the context of the
+        sequence inline and only if required.
+        """
         self._current_position += 1
-        self._current_approximation = self.next_element()
+        previous_context = decimal.getcontext()
+        if previous_context is self.context:
+            self._current_approximation = self.next_element()
+        else:
+            decimal.setcontext(self.context)
+            try:
+                self._current_approximation = self.next_element()
+            finally:
+                decimal.setcontext(previous_context)
         return self._current_approximation
 
     @abstractmethod
     def next_element(self) -> Decimal:
         """Calculates the next element in the sequence. Must be implemented by subclasses."""
 
+    @in_sequence_context
     def at(self, position: int) -> Union[Decimal, None]:
         """Returns the approximation at a specific position in the sequence.
 
@@ -80,10 +191,51 @@ class ApproximationSequence(ABC, RealValuedSequence):
         return self.current_approximation
 
 
-@dataclass
+def leibniz_fixed_point_sum(start: int, stop: int, scale: int) -> int:
+    """Sums the Leibniz terms `start` up to (excluding) `stop` in fixed-point arithmetic.
+
+    Consecutive terms of opposite sign are paired, 1/(2k+1) - 1/(2k+3) being
+    2/((2k+1)(2k+3)), so only one integer division per pair is required. Every
+    division truncates by less than one unit, which bounds the error of the
+    result by the number of pairs plus two units.
+
+    Args:
+        start (int): The index of the first term to sum.
+        stop (int): The index of the first term not to sum.
+        scale (int): The scaling factor of the fixed-point representation.
+
+    Returns:
+        int: The sum of the terms multiplied by `scale`.
+    """
+    total = 0
+    if start % 2 == 1 and start < stop:
+        total -= scale // (2 * start + 1)
+        start += 1
+    if (stop - start) % 2 == 1:
+        stop -= 1
+        total += scale // (2 * stop + 1)
+
+    # Denominators of the pairs starting at the even indices `start`, `start + 2`, ...
+    return total + sum(
+        map(
+            (2 * scale).__floordiv__,
+            map(
+                mul,
+                range(2 * start + 1, 2 * stop + 1, 4),
+                range(2 * start + 3, 2 * stop + 3, 4),
+            ),
+        )
+    )
+
+
+@dataclass(slots=True)
 class Leibniz(ApproximationSequence):
     """Leibniz series for pi approximation."""
 
+    supports_random_access = True
+    # The partial sums alternate around pi, approaching it from either side
+    monotone_subsequences = 2
+
     partial_sum: Decimal = Decimal(0)
 
     def next_element(self) -> Decimal:
@@ -95,84 +247,672 @@ class Leibniz(ApproximationSequence):
         )
         return 4 * self.partial_sum
 
+    @in_sequence_context
+    def at(self, position: int) -> Union[Decimal, None]:
+        """Returns the approximation at a specific position in the sequence.
+
+        The terms between the current and the requested position are summed in
+        fixed-point arithmetic, with enough guard digits for the truncation
+        errors to stay below the current decimal precision.
+
+        Args:
+            position (int): The position in the sequence.
+
+        Returns:
+            Decimal: The approximation at the specified position, or None if
+                     the position has already been passed.
+        """
+        if self.current_position >= position:
+            return ApproximationSequence.at(self, position)
+
+        digits = self.context.prec + len(str(position)) + 1
+        scaled_sum = int(self.partial_sum.scaleb(digits)) + leibniz_fixed_point_sum(
+            self.current_position + 1, position + 1, 10**digits
+        )
+
+        self.partial_sum = Decimal(scaled_sum).scaleb(-digits)
+        self._current_position = position
+        self._current_approximation = 4 * self.partial_sum
+        return self.current_approximation
+
+
+def draw_monte_carlo_batch(seed: int, batch_index: int, batch_size: int) -> np.ndarray:
+    """Draws a batch of samples and tests which of them lie inside the unit circle.
+
+    All samples come from a single stream of the seed, of which sample i uses the
+    random numbers 2i and 2i + 1, so the samples do not depend on the batch size.
+    The stream is advanced to the first sample of the batch in logarithmic time,
+    so any batch can be drawn independently of all the others.
+
+    Args:
+        seed (int): The seed of the Monte Carlo sequence.
+        batch_index (int): The index of the batch to draw.
+        batch_size (int): The number of samples in the batch.
+
+    Returns:
+        np.ndarray: A boolean array marking the samples inside of the unit circle.
+    """
+    bit_generator = np.random.PCG64(seed)
+    bit_generator.advance(2 * batch_index * batch_size)
+    samples = np.random.Generator(bit_generator).random((batch_size, 2))
+    np.square(samples, out=samples)
+    return samples[:, 0] + samples[:, 1] <= 1
+
+
+def count_monte_carlo_hits(
+    seed: int, first_batch: int, stop_batch: int, batch_size: int
+) -> int:
+    """Counts the samples inside of the unit circle in a range of batches.
 
-@dataclass
+    Args:
+        seed (int): The seed of the Monte Carlo sequence.
+        first_batch (int): The index of the first batch to count.
+        stop_batch (int): The index of the first batch not to count.
+        batch_size (int): The number of samples per batch.
+
+    Returns:
+        int: The number of samples inside of the unit circle.
+    """
+    return sum(
+        int(np.count_nonzero(draw_monte_carlo_batch(seed, batch_index, batch_size)))
+        for batch_index in range(first_batch, stop_batch)
+    )
+
+
+@functools.cache
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the process pool of the given size shared by all sequences.
+
+    Sequences are copied and pickled, e.g. into checkpoints, so they cannot hold
+    a pool themselves. Instead, the pool is created on first use and kept for
+    all later calls, instead of starting new processes for every call.
+
+    Args:
+        workers (int): The number of worker processes.
+
+    Returns:
+        ProcessPoolExecutor: The process pool.
+    """
+    return ProcessPoolExecutor(workers)
+
+
+@dataclass(slots=True)
+# pylint: disable=too-many-instance-attributes
 class MonteCarlo(ApproximationSequence):
-    """Monte Carlo method for pi approximation."""
+    """Monte Carlo method for pi approximation.
+
+    Samples are drawn from the stream of `seed` in batches of `batch_size` points,
+    each of which starts by advancing the stream to its first sample. Within the
+    current batch the cumulative number of hits is kept, so the approximation at
+    any position of the batch is available without drawing further samples.
+    Batches before a requested position are only counted, which is split across
+    the shared `process_pool` of `workers` processes if more than one worker is
+    requested. The hit counts depend on neither the batch size nor the number of
+    workers.
+    """
+
+    supports_random_access = True
 
     samples_inside_of_unit_circle: int = 0
-    generator = random.Random(420)
+    seed: int = 420
+    batch_size: int = 2**14
+    workers: int = 1
+    _batch_start: int = 0
+    _hits_before_batch: int = 0
+    _batch_hits: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int32), repr=False
+    )
+
+    def _count_batches(self, first_batch: int, stop_batch: int) -> int:
+        """Counts the hits of whole batches, using a process pool if configured."""
+        if self.workers == 1 or stop_batch - first_batch < self.workers:
+            return count_monte_carlo_hits(
+                self.seed, first_batch, stop_batch, self.batch_size
+            )
+
+        bounds = [
+            first_batch + (stop_batch - first_batch) * worker // self.workers
+            for worker in range(self.workers + 1)
+        ]
+        return sum(
+            process_pool(self.workers).map(
+                count_monte_carlo_hits,
+                repeat(self.seed),
+                bounds[:-1],
+                bounds[1:],
+                repeat(self.batch_size),
+            )
+        )
+
+    def _advance_to(self, position: int):
+        """Counts the samples inside of the unit circle up to `position`."""
+        if (
+            self._batch_hits.size == 0
+            or self._batch_start + self.batch_size <= position
+        ):
+            if self._batch_hits.size != 0:
+                self._hits_before_batch += int(self._batch_hits[-1])
+                self._batch_start += self.batch_size
+            # Fast-forward whole batches, of which only the hit count is required
+            first_batch = self._batch_start // self.batch_size
+            stop_batch = position // self.batch_size
+            self._hits_before_batch += self._count_batches(first_batch, stop_batch)
+            self._batch_start = stop_batch * self.batch_size
+            self._batch_hits = np.cumsum(
+                draw_monte_carlo_batch(self.seed, stop_batch, self.batch_size),
+                dtype=np.int32,
+            )
+
+        self.samples_inside_of_unit_circle = self._hits_before_batch + int(
+            self._batch_hits[position - self._batch_start]
+        )
 
     def next_element(self) -> Decimal:
-        """Generates a random sample and updates the pi approximation."""
-        random_x, random_y = self.generator.random(), self.generator.random()
-        if sqrt(random_x**2 + random_y**2) <= 1:
-            self.samples_inside_of_unit_circle += 1
+        """Advances by one sample and updates the pi approximation."""
+        self._advance_to(self.current_position)
         return (
             4
             * Decimal(self.samples_inside_of_unit_circle)
             / Decimal(self.current_position + 1)
         )
 
+    @in_sequence_context
+    def at(self, position: int) -> Union[Decimal, None]:
+        """Returns the approximation at a specific position in the sequence.
+
+        Whole batches between the current and the requested position are
+        skipped, only the requested position is converted to a Decimal.
 
-@dataclass
+        Args:
+            position (int): The position in the sequence.
+
+        Returns:
+            Decimal: The approximation at the specified position, or None if
+                     the position has already been passed.
+        """
+        if self.current_position >= position:
+            return ApproximationSequence.at(self, position)
+
+        self._current_position = position
+        self._current_approximation = self.next_element()
+        return self.current_approximation
+
+
+# Additional digits carried by the precision-scheduled Gauss-Legendre iterations
+GAUSS_LEGENDRE_GUARD_DIGITS = 10
+
+
+def reciprocal_sqrt(x: Decimal, precision: int) -> Decimal:
+    """Computes 1 / sqrt(x) using Newton's iteration with a doubling precision.
+
+    Newton's iteration r <- r + r (1 - x r^2) / 2 is self-correcting: each step
+    roughly doubles the number of correct digits of r, regardless of the errors
+    made in earlier steps. Every step thus only works at about twice the precision
+    of the step before, and only the last one at the full precision. Unlike
+    `Decimal.sqrt`, the steps only multiply, which is fast for large numbers.
+
+    Args:
+        x (Decimal): The positive number to take the reciprocal square root of.
+        precision (int): The number of significant digits to compute.
+
+    Returns:
+        Decimal: The reciprocal square root, accurate up to the last few digits.
+    """
+    precisions = []
+    while precision > 16:
+        precisions.append(precision)
+        precision = precision // 2 + 1
+
+    with decimal.localcontext(prec=precision + 2):
+        reciprocal = 1 / x.sqrt()
+    for working_precision in reversed(precisions):
+        with decimal.localcontext(prec=working_precision):
+            reciprocal += reciprocal * (1 - +x * reciprocal * reciprocal) / 2
+    return reciprocal
+
+
+@dataclass(slots=True)
 class GaussLegendre(ApproximationSequence):
-    """Gauss-Legendre algorithm for pi approximation."""
+    """Gauss-Legendre algorithm for pi approximation.
+
+    The factor `p` is always a power of two, so only its exponent is stored.
+
+    With `precision_schedule`, square roots are computed by `reciprocal_sqrt`
+    instead of `Decimal.sqrt`. The squared differences of `a`, which shrink
+    quadratically, are computed with only as many digits as reach into the
+    precision of `t`.
+    The iteration itself still runs at the full precision, since errors of `a`,
+    `b` and `t` are carried into all later iterations.
+    """
+
+    supports_random_access = True
+    # The approximations approach pi from below
+    monotone_subsequences = 1
 
     a: Decimal = Decimal(1)
     _b: InitVar[Decimal | None] = None
     b: Decimal = Decimal("nan")
     t: Decimal = Decimal(1) / Decimal(4)
-    p: Decimal = Decimal(1)
+    p_exponent: int = 0
+    precision_schedule: bool = True
 
     def __post_init__(self, _b):
-        if _b is None:
-            self.b = Decimal(1) / Decimal(2).sqrt()
-        else:
+        if _b is not None:
             self.b = _b
+            return
 
-    def next_element(self) -> Decimal:
-        """Calculates the next element in the Gauss-Legendre algorithm."""
-        precision = decimal.getcontext().prec
-        if precision < self.current_position or precision < 2**self.current_position:
-            return self.current_approximation
+        with decimal.localcontext(self.context):
+            if self.precision_schedule:
+                self.b = +reciprocal_sqrt(
+                    Decimal(2), self.context.prec + GAUSS_LEGENDRE_GUARD_DIGITS
+                )
+            else:
+                self.b = Decimal(1) / Decimal(2).sqrt()
+
+    @property
+    def p(self) -> int:
+        """Returns the factor by which the squared differences of `a` are weighted."""
+        return 1 << self.p_exponent
 
+    def reached_precision_limit(self, position: int) -> bool:
+        """Whether the iteration at `position` no longer changes the approximation.
+
+        The number of correct digits doubles with every iteration, so the
+        iterations stop once 2^position exceeds the decimal precision.
+        """
+        return position >= self.context.prec.bit_length()
+
+    def iterate(self):
+        """Performs the next iteration, without calculating its approximation."""
         a = (self.a + self.b) / 2
-        self.b = (self.a * self.b).sqrt()
-        self.t = self.t - self.p * (self.a - a) ** 2
-        self.p = 2 * self.p
+        if not self.precision_schedule:
+            self.b = (self.a * self.b).sqrt()
+            self.t = self.t - self.p * (self.a - a) ** 2
+        else:
+            precision = self.context.prec
+            product = self.a * self.b
+            self.b = product * reciprocal_sqrt(
+                product, precision + GAUSS_LEGENDRE_GUARD_DIGITS
+            )
+            difference = self.a - a
+            # The squared difference is about 10^(2 * adjusted) times smaller than t
+            with decimal.localcontext(
+                prec=max(precision + 2 * difference.adjusted(), 0)
+                + GAUSS_LEGENDRE_GUARD_DIGITS
+            ):
+                correction = self.p * difference * difference
+            self.t = self.t - correction
+        self.p_exponent += 1
         self.a = a
+
+    def approximation(self) -> Decimal:
+        """Calculates the approximation of the current iteration."""
         return ((self.a + self.b) ** 2) / (4 * self.t)
 
+    def next_element(self) -> Decimal:
+        """Calculates the next element in the Gauss-Legendre algorithm."""
+        if self.reached_precision_limit(self.current_position):
+            return self.current_approximation
+
+        self.iterate()
+        return self.approximation()
+
+    @in_sequence_context
+    def at(self, position: int) -> Union[Decimal, None]:
+        """Returns the approximation at a specific position in the sequence.
+
+        Only the approximation of the last iteration is calculated, and no
+        iterations are performed once the precision limit is reached.
+
+        Args:
+            position (int): The position in the sequence.
+
+        Returns:
+            Decimal: The approximation at the specified position, or None if
+                     the position has already been passed.
+        """
+        if self.current_position >= position:
+            return ApproximationSequence.at(self, position)
+
+        iterated = False
+        while self.current_position < position and not self.reached_precision_limit(
+            self.current_position
+        ):
+            self.iterate()
+            self._current_position += 1
+            iterated = True
+
+        self._current_position = position
+        if iterated:
+            self._current_approximation = self.approximation()
+        return self.current_approximation
+
 
-@dataclass
+# Constants of the Chudnovsky series, `CHUDNOVSKY_C3_OVER_24` is 640320^3 / 24
+CHUDNOVSKY_A = 13591409
+CHUDNOVSKY_B = 545140134
+CHUDNOVSKY_C3_OVER_24 = 640320**3 // 24
+# Additional digits carried by the fixed-point state to absorb truncation errors
+CHUDNOVSKY_GUARD_DIGITS = 10
+
+
+def chudnovsky_binary_split(start: int, stop: int) -> tuple[int, int, int]:
+    """Evaluate the Chudnovsky terms `start` up to (excluding) `stop` by binary splitting.
+
+    The terms are combined recursively into the three integers P, Q and T, such
+    that the sum of the terms divided by the product of all term ratios up to
+    `start` equals T / Q. For `start == 0` this means that T / Q is exactly the
+    partial sum of the series, so only a single division is required in the end.
+
+    Args:
+        start (int): The index of the first term to evaluate.
+        stop (int): The index of the first term not to evaluate.
+
+    Returns:
+        tuple[int, int, int]: The integers P, Q and T of the range.
+    """
+    if stop - start == 1:
+        if start == 0:
+            p = q = 1
+        else:
+            p = (6 * start - 5) * (2 * start - 1) * (6 * start - 1)
+            q = start**3 * CHUDNOVSKY_C3_OVER_24
+        t = p * (CHUDNOVSKY_A + CHUDNOVSKY_B * start)
+        return p, q, -t if start % 2 == 1 else t
+
+    middle = (start + stop) // 2
+    p_left, q_left, t_left = chudnovsky_binary_split(start, middle)
+    p_right, q_right, t_right = chudnovsky_binary_split(middle, stop)
+    return p_left * p_right, q_left * q_right, t_left * q_right + p_left * t_right
+
+
+@dataclass(slots=True)
 class Chudnovsky(ApproximationSequence):
-    """Chudnovsky algorithm for pi approximation."""
+    """Chudnovsky algorithm for pi approximation.
 
-    partial_sum: Decimal = Decimal(0)
+    The current term and the partial sum of the series are kept as fixed-point
+    integers scaled by 10**digits. Each term is derived from its predecessor
+    through the ratio of consecutive terms, so advancing the sequence costs a
+    constant number of integer operations.
+    """
+
+    supports_random_access = True
+    # The partial sums alternate around pi, approaching it from either side
+    monotone_subsequences = 2
+
+    partial_sum: int = 0
+    term: int | None = None
+    digits: int | None = None
     _c: InitVar[Decimal | None] = None
     c: Decimal = Decimal("nan")
 
     def __post_init__(self, _c):
         if _c is None:
-            self.c = Decimal(426880) * Decimal(10005).sqrt()
+            with decimal.localcontext(self.context):
+                self.c = Decimal(426880) * Decimal(10005).sqrt()
         else:
             self.c = _c
+        if self.digits is None:
+            self.digits = self.context.prec + CHUDNOVSKY_GUARD_DIGITS
+        if self.term is None:
+            self.term = 10**self.digits
 
     def next_element(self) -> Decimal:
         """Calculates the next element in the Chudnovsky algorithm."""
-        if decimal.getcontext().prec < 14 * self.current_position:
+        k = self.current_position
+        if self.context.prec < 14 * k:
+            return self.current_approximation
+
+        if k > 0:
+            self.term = -(self.term * (6 * k - 5) * (2 * k - 1) * (6 * k - 1)) // (
+                k**3 * CHUDNOVSKY_C3_OVER_24
+            )
+        self.partial_sum += self.term * (CHUDNOVSKY_A + CHUDNOVSKY_B * k)
+        return self.approximation_from_partial_sum()
+
+    def approximation_from_partial_sum(self) -> Decimal:
+        """Converts the fixed-point partial sum into an approximation of pi."""
+        return self.c / Decimal(self.partial_sum).scaleb(-self.digits)
+
+    @in_sequence_context
+    def at(self, position: int) -> Union[Decimal, None]:
+        """Returns the approximation at a specific position in the sequence.
+
+        Instead of walking through every term, the terms up to `position` are
+        evaluated at once using binary splitting, which only requires a single
+        division to obtain the fixed-point partial sum.
+
+        Args:
+            position (int): The position in the sequence.
+
+        Returns:
+            Decimal: The approximation at the specified position, or None if
+                     the position has already been passed.
+        """
+        if self.current_position >= position:
+            return ApproximationSequence.at(self, position)
+
+        # Terms beyond this index do not contribute at the current precision
+        if self.current_position >= self.context.prec // 14:
+            self._current_position = position
+            return self.current_approximation
+        number_of_terms = min(position, self.context.prec // 14) + 1
+        p, q, t = chudnovsky_binary_split(0, number_of_terms)
+
+        scale = 10**self.digits
+        self.term = (-p if number_of_terms % 2 == 0 else p) * scale // q
+        self.partial_sum = t * scale // q
+        self._current_position = position
+        self._current_approximation = self.approximation_from_partial_sum()
+        return self.current_approximation
+
+
+# Machin-like formulas pi/4 = sum of c * arctan(1/x), given as pairs (c, x)
+MACHIN_FORMULAS = {
+    "Machin": ((4, 5), (-1, 239)),
+    "Takano": ((12, 49), (32, 57), (-5, 239), (12, 110443)),
+}
+# Additional digits carried by the fixed-point state to absorb truncation errors
+MACHIN_GUARD_DIGITS = 10
+
+
+def arccot_fixed_point_sum(
+    x: int, start: int, stop: int, power: int
+) -> tuple[int, int]:
+    """Sums the terms `start` up to (excluding) `stop` of the series of arctan(1/x).
+
+    The k-th term of the series is (-1)^k / ((2k + 1) x^(2k + 1)). In fixed-point
+    arithmetic, x^-(2k + 1) is kept as `power`, which is divided by x^2 from one
+    term to the next. Once it vanishes, so do all further terms.
+
+    Args:
+        x (int): The reciprocal of the argument of the arctangent.
+        start (int): The index of the first term to sum.
+        stop (int): The index of the first term not to sum.
+        power (int): The scaling factor divided by x^(2 * start + 1).
+
+    Returns:
+        tuple[int, int]: The sum of the terms multiplied by the scaling factor and
+                         the scaling factor divided by x^(2 * stop + 1).
+    """
+    total = 0
+    x_squared = x * x
+    for k in range(start, stop):
+        if not power:
+            break
+        term = power // (2 * k + 1)
+        total += -term if k % 2 == 1 else term
+        power //= x_squared
+    return total, power
+
+
+@dataclass(slots=True)
+class Machin(ApproximationSequence):
+    """Machin-like formula for pi approximation.
+
+    Pi is a weighted sum of arctangents, each of which is evaluated by its series
+    on fixed-point integers scaled by 10**digits. Every element adds the next term
+    of all of the series, the `formula` is one of `MACHIN_FORMULAS`. The series
+    are independent of each other, so `at` evaluates them in the shared
+    `process_pool` of `workers` processes if more than one worker is requested.
+    """
+
+    supports_random_access = True
+    # The partial sums alternate around pi, approaching it from either side
+    monotone_subsequences = 2
+
+    formula: str = "Machin"
+    workers: int = 1
+    digits: int | None = None
+    # The partial sum of each of the series and the power of its next term
+    partial_sums: list[int] = field(default_factory=list)
+    powers: list[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.digits is None:
+            self.digits = self.context.prec + MACHIN_GUARD_DIGITS
+        if not self.powers:
+            scale = 10**self.digits
+            self.partial_sums = [0 for _ in MACHIN_FORMULAS[self.formula]]
+            self.powers = [scale // x for _, x in MACHIN_FORMULAS[self.formula]]
+
+    def _sum_terms(self, start: int, stop: int, parallel: bool = False):
+        """Adds the terms `start` up to (excluding) `stop` to all of the series."""
+        arguments = (
+            [x for _, x in MACHIN_FORMULAS[self.formula]],
+            repeat(start),
+            repeat(stop),
+            self.powers,
+        )
+        if parallel:
+            results = list(
+                process_pool(self.workers).map(arccot_fixed_point_sum, *arguments)
+            )
+        else:
+            results = list(map(arccot_fixed_point_sum, *arguments))
+
+        for index, (total, power) in enumerate(results):
+            self.partial_sums[index] += total
+            self.powers[index] = power
+
+    def approximation_from_partial_sums(self) -> Decimal:
+        """Combines the fixed-point partial sums into an approximation of pi."""
+        return Decimal(
+            4
+            * sum(
+                coefficient * partial_sum
+                for (coefficient, _), partial_sum in zip(
+                    MACHIN_FORMULAS[self.formula], self.partial_sums
+                )
+            )
+        ).scaleb(-self.digits)
+
+    def next_element(self) -> Decimal:
+        """Adds the next term of each of the arctangent series."""
+        # Terms beyond the fixed-point precision vanish
+        if not any(self.powers):
+            return self.current_approximation
+
+        self._sum_terms(self.current_position, self.current_position + 1)
+        return self.approximation_from_partial_sums()
+
+    @in_sequence_context
+    def at(self, position: int) -> Union[Decimal, None]:
+        """Returns the approximation at a specific position in the sequence.
+
+        The terms between the current and the requested position are summed for
+        each series at once, in parallel if more than one worker is requested.
+
+        Args:
+            position (int): The position in the sequence.
+
+        Returns:
+            Decimal: The approximation at the specified position, or None if
+                     the position has already been passed.
+        """
+        if self.current_position >= position:
+            return ApproximationSequence.at(self, position)
+
+        self._sum_terms(
+            self.current_position + 1,
+            position + 1,
+            self.workers > 1 and len(self.powers) > 1,
+        )
+        self._current_position = position
+        self._current_approximation = self.approximation_from_partial_sums()
+        return self.current_approximation
+
+
+@dataclass(slots=True)
+class DigitSpigot:
+    """Gibbons' unbounded spigot algorithm for the decimal digits of pi.
+
+    The series of Lambert is composed into a linear fractional transformation
+    held in the integers `q`, `r` and `t`, while `k`, `n` and `l` track the next
+    term and the candidate for the next digit. A digit is produced as soon as
+    the transformation determines it, so the digits are streamed one after
+    another without fixing their number up front.
+    """
+
+    q: int = 1
+    r: int = 0
+    t: int = 1
+    k: int = 1
+    n: int = 3
+    l: int = 3
+
+    def __iter__(self) -> Iterator[int]:
+        """Returns an iterator over the remaining digits of pi."""
+        return iter(self.next_digit, None)
+
+    def next_digit(self) -> int:
+        """Produces the next digit of pi, consuming as many terms as required."""
+        while 4 * self.q + self.r - self.t >= self.n * self.t:
+            self.q, self.r, self.t, self.k, self.n, self.l = (
+                self.q * self.k,
+                (2 * self.q + self.r) * self.l,
+                self.t * self.l,
+                self.k + 1,
+                (self.q * (7 * self.k + 2) + self.r * self.l) // (self.t * self.l),
+                self.l + 2,
+            )
+
+        digit = self.n
+        self.q, self.r, self.n = (
+            10 * self.q,
+            10 * (self.r - self.n * self.t),
+            10 * (3 * self.q + self.r) // self.t - 10 * self.n,
+        )
+        return digit
+
+
+@dataclass(slots=True)
+class Spigot(ApproximationSequence):
+    """Spigot algorithm for pi approximation.
+
+    Every element appends the next digit produced by a `DigitSpigot`, so the
+    approximation at position i consists of the first i + 1 digits of pi. Digits
+    beyond the decimal precision would be rounded away, so no further digits are
+    produced once the precision is reached.
+    """
+
+    # Every element only appends a digit of pi
+    monotone_subsequences = 1
+
+    digit_spigot: DigitSpigot = field(default_factory=DigitSpigot)
+    # The digits produced so far, as an integer
+    produced_digits: int = 0
+
+    def next_element(self) -> Decimal:
+        """Appends the next digit of pi to the approximation."""
+        # The approximation at position i has i + 1 digits
+        if self.context.prec <= self.current_position:
             return self.current_approximation
 
-        self.partial_sum += Decimal(
-            factorial(6 * self.current_position)
-            * (13591409 + 545140134 * self.current_position)
-        ) / Decimal(
-            factorial(3 * self.current_position)
-            * factorial(self.current_position) ** 3
-            * (-640320) ** (3 * self.current_position)
+        self.produced_digits = (
+            10 * self.produced_digits + self.digit_spigot.next_digit()
         )
-        return self.c * (1 / self.partial_sum)
+        return Decimal(self.produced_digits).scaleb(-self.current_position)
 
 
 APPROXIMATION_SEQUENCES: dict[str, type] = {
@@ -180,6 +920,8 @@ APPROXIMATION_SEQUENCES: dict[str, type] = {
     "MonteCarlo": MonteCarlo,
     "GaussLegendre": GaussLegendre,
     "Chudnovsky": Chudnovsky,
+    "Spigot": Spigot,
+    "Machin": Machin,
 }
 
 
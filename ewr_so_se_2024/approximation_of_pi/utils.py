@@ -4,37 +4,67 @@ Utility Functions and Click Options for Pi Approximation Analysis
 This module provides utility functions and predefined Click options for analyzing
 Pi approximation sequences. It includes functions for finding mismatches between
 sequences, setting up the decimal context, and retrieving color and marker settings
-for plotting. It also loads the value of Pi from a file.
+for plotting. It also provides the value of Pi, loaded on first access from the
+reference digits in `reference.PI_REFERENCE`.
 
 Functions:
     find_first_mismatch(xs, ys):
         Find the first mismatch between two iterables.
+    common_prefix_length(xs, ys):
+        Find the length of the common prefix of two byte strings.
+    significant_digits(number):
+        Get the digits of the coefficient of a Decimal as a byte string.
+    first_mismatching_digit(approximation):
+        Find the first digit in which an approximation differs from Pi.
     get_color_and_marker(sequence_name, number_of_samples):
         Get color and marker settings based on sequence name.
     setup_decimal_context(precision):
         Set up the decimal context with the given precision.
+    create_checkpointer(file_path, precision, parameters, interval, resume_from_file):
+        Create the checkpointer of a run, reporting incompatible checkpoints.
+    create_sequence(backend, sequence_name, workers):
+        Create a sequence, passing the number of workers to sequences using them.
 
 Click Options:
     samples: Click option for specifying the number of samples to take from the sequence.
     sequence_names: Click option for specifying the sequence names to analyze.
     digits: Click option to specify the number of digits to approximate.
     export_to: Click option to specify a file for exporting to.
+    backend: Click option to specify the arithmetic backend of the sequences.
+    checkpoint_path: Click option to specify a file for checkpointing a run.
+    resume: Click option to continue a run from its checkpoint.
+    checkpoint_interval: Click option to specify the time between two checkpoints.
+    use_cache: Click option to reuse and store results in the result cache.
+    workers: Click option to specify the number of worker processes of a sequence.
 
 Attributes:
-    PI (Decimal): The value of Pi loaded from a file.
+    PI (Decimal): The value of Pi to all of the stored reference digits.
+    BACKENDS (dict): A dictionary mapping backend names to their sequence classes.
 """
 
 from collections.abc import Iterable
+from dataclasses import fields
+from functools import cache
 from itertools import zip_longest
 import sys
 from decimal import Decimal
-from os import path
-from typing import Optional, TypeVar
+from typing import Any, Optional, TypeVar
 import decimal
 
 import click
 
-from ewr_so_se_2024.approximation_of_pi.sequences import APPROXIMATION_SEQUENCES
+from ewr_so_se_2024.approximation_of_pi.checkpoint import Checkpointer
+from ewr_so_se_2024.approximation_of_pi.fixed_point import FIXED_POINT_SEQUENCES
+from ewr_so_se_2024.approximation_of_pi.reference import PI_REFERENCE
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    APPROXIMATION_SEQUENCES,
+    ApproximationSequence,
+)
+
+BACKENDS = {
+    "decimal": APPROXIMATION_SEQUENCES,
+    "integer": FIXED_POINT_SEQUENCES,
+}
 
 # Click option for specifying the number of samples to take from the sequence
 samples = click.option(
@@ -71,12 +101,62 @@ export_to = click.option(
     help="Export the generated plot to a specified file.",
 )
 
-# Load the value of PI from a file and store it as a Decimal
-with open(path.join(path.dirname(__file__), "PI"), encoding="utf-8") as PI_file:
-    old_max_str_digits = sys.get_int_max_str_digits()
-    sys.set_int_max_str_digits(0)
-    PI = Decimal(PI_file.read().translate(str.maketrans("", "", "\n\r\t ")))
-    sys.set_int_max_str_digits(old_max_str_digits)
+# Click option to specify the arithmetic backend of the sequences
+backend = click.option(
+    "--backend",
+    type=click.Choice(list(BACKENDS.keys()), case_sensitive=False),
+    default="decimal",
+    help="The arithmetic backend used by the sequences.",
+)
+
+# Click option to specify a file for checkpointing the progress of a run
+checkpoint_path = click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Periodically save the progress of the run to a specified file.",
+)
+
+# Click option to continue a run from its checkpoint
+resume = click.option(
+    "--resume/--no-resume",
+    default=False,
+    help="Continue the run from its checkpoint file, if it exists.",
+)
+
+# Click option to specify the minimum time between two checkpoints
+checkpoint_interval = click.option(
+    "--checkpoint-interval",
+    type=click.FloatRange(min=0),
+    default=60.0,
+    help="The minimum number of seconds between two checkpoints.",
+)
+
+# Click option to reuse and store results in the persistent result cache
+use_cache = click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    help="Reuse the results cached by earlier runs and cache the new ones.",
+)
+
+# Click option to specify the number of worker processes used within a sequence
+workers = click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of worker processes used by `at` within a single sequence "
+    "(MonteCarlo and Machin).",
+)
+
+
+@cache
+def __getattr__(name: str) -> Decimal:
+    """Loads `PI` from the reference digits the first time it is accessed."""
+    if name != "PI":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pi_digits = PI_REFERENCE.digits(len(PI_REFERENCE)).decode("ascii")
+    return Decimal(f"{pi_digits[0]}.{pi_digits[1:]}")
 
 
 AItem = TypeVar("AItem")
@@ -102,6 +182,72 @@ def find_first_mismatch(
     return None
 
 
+def common_prefix_length(xs: bytes, ys: bytes) -> int:
+    """Find the length of the common prefix of two byte strings.
+
+    The byte strings are compared slice by slice, which keeps the comparisons in
+    C instead of iterating over every single byte in Python.
+
+    Args:
+        xs: The first byte string.
+        ys: The second byte string.
+
+    Returns:
+        The number of leading bytes both byte strings have in common.
+    """
+    length = min(len(xs), len(ys))
+    if xs[:length] == ys[:length]:
+        return length
+
+    # Bisect the mismatch, while `xs[:lower] == ys[:lower]` and `xs[:upper] != ys[:upper]`
+    lower, upper = 0, length
+    while upper - lower > 1:
+        middle = (lower + upper) // 2
+        if xs[lower:middle] == ys[lower:middle]:
+            lower = middle
+        else:
+            upper = middle
+    return lower
+
+
+def significant_digits(number: Decimal) -> bytes:
+    """Get the digits of the coefficient of a Decimal as an ASCII byte string.
+
+    This is equivalent to the digits of `number.as_tuple()` without building a
+    tuple of Python integers.
+
+    Args:
+        number: The Decimal to get the digits of.
+
+    Returns:
+        The digits of the coefficient, or an empty byte string for special values.
+    """
+    if not number.is_finite():
+        return b""
+    mantissa = str(number.copy_abs()).partition("E")[0]
+    return (mantissa.replace(".", "").lstrip("0") or "0").encode("ascii")
+
+
+def first_mismatching_digit(approximation: Decimal) -> int:
+    """Find the first digit in which an approximation differs from Pi.
+
+    This is equivalent to the index returned by `find_first_mismatch` for the
+    digit tuples of the approximation and `PI`, but compares the digits in bulk.
+    The reference digits are extended as needed, so they always hold at least
+    one digit more than the approximation.
+
+    Args:
+        approximation: The approximation of Pi.
+
+    Returns:
+        The index of the first mismatching digit.
+    """
+    approximation_digits = significant_digits(approximation)
+    return common_prefix_length(
+        approximation_digits, PI_REFERENCE.digits(len(approximation_digits) + 1)
+    )
+
+
 def get_color_and_marker(sequence_name: str, number_of_samples: int) -> dict:
     """Utility function to get color and marker based on sequence name.
 
@@ -134,3 +280,54 @@ def setup_decimal_context(precision: int):
     """
     sys.set_int_max_str_digits(0)
     decimal.getcontext().prec = precision
+
+
+def create_checkpointer(
+    file_path: Optional[str],
+    precision: int,
+    parameters: dict[str, Any],
+    interval: float,
+    resume_from_file: bool,
+) -> Checkpointer:
+    """Create the checkpointer of a run, reporting incompatible checkpoints.
+
+    Args:
+        file_path (str, optional): The path of the checkpoint file.
+        precision (int): The decimal precision of the run.
+        parameters (dict): The parameters which determine the results of the run.
+        interval (float): The minimum number of seconds between two checkpoints.
+        resume_from_file (bool): Whether to continue from an existing checkpoint.
+
+    Returns:
+        Checkpointer: The checkpointer of the run.
+    """
+    if resume_from_file and file_path is None:
+        raise click.UsageError("--resume requires a --checkpoint file")
+
+    try:
+        return Checkpointer(
+            file_path, precision, parameters, interval, resume_from_file
+        )
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
+
+
+def create_sequence(
+    backend_name: str, sequence_name: str, number_of_workers: int = 1
+) -> ApproximationSequence:
+    """Create a sequence, passing the number of workers to sequences using them.
+
+    Args:
+        backend_name (str): The name of the arithmetic backend.
+        sequence_name (str): The name of the sequence.
+        number_of_workers (int): The number of worker processes of the sequence.
+
+    Returns:
+        ApproximationSequence: The new sequence.
+    """
+    sequence_class = BACKENDS[backend_name][sequence_name]
+    if number_of_workers > 1 and "workers" in {
+        sequence_field.name for sequence_field in fields(sequence_class)
+    }:
+        return sequence_class(workers=number_of_workers)
+    return sequence_class()
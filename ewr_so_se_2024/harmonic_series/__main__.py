@@ -4,31 +4,31 @@ and performing summation using different algorithms and data types.
 The results can be optionally displayed and saved to a file.
 """
 
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 import click
 from yaspin import yaspin
 
-from ewr_so_se_2024.harmonic_series.utils import NotRequiredIf
-from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
-    harmonic_sum,
-    forward_sum,
-    kahan_sum,
-    vectorized_sum,
+from ewr_so_se_2024.harmonic_series.utils import (
+    DATA_TYPES,
+    SUMMATION_ALGORITHMS,
+    NotRequiredIf,
+)
+from ewr_so_se_2024.harmonic_series.asymptotic import (
+    harmonic_number,
+    harmonic_sum_errors,
+)
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import harmonic_sum
+from ewr_so_se_2024.harmonic_series.compensated_summation import (
+    ERROR_BOUND_FACTORS,
+    harmonic_sum_error_bounds,
 )
 from ewr_so_se_2024.harmonic_series.tools_read_save import load_data, save_data
 from ewr_so_se_2024.harmonic_series.py_logspace import py_logspace
 
 
-# Define available summation algorithms and data types
-SUMMATION_ALGORITHMS = {
-    "Forward": forward_sum,
-    "Kahan": kahan_sum,
-    "Vectorized": vectorized_sum,
-}
-DATA_TYPES = {"float16": np.float16, "float32": np.float32, "float64": np.float64}
-
-
 @click.command()
 @click.option(
     "--start",
@@ -88,7 +88,8 @@ DATA_TYPES = {"float16": np.float16, "float32": np.float32, "float64": np.float6
     type=click.Choice(list(SUMMATION_ALGORITHMS.keys()), case_sensitive=False),
     default="Forward",
     show_default=True,
-    help="The algorithm to use for summation (Forward, Kahan, Vectorized).",
+    help="The algorithm to use for summation "
+    "(Forward, Kahan, Vectorized, Neumaier, Pairwise, Exact).",
     cls=NotRequiredIf,
     not_required_if="load",
     prompt="Choose the summation algorithm:",
@@ -117,7 +118,14 @@ DATA_TYPES = {"float16": np.float16, "float32": np.float32, "float64": np.float6
     type=click.Path(dir_okay=False, writable=True),
     help="Export the generated plot to a specified file.",
 )
-# pylint: disable=too-many-arguments
+@click.option(
+    "--errors/--no-errors",
+    default=False,
+    show_default=True,
+    help="Plot the absolute and relative errors of the sums next to them, measured "
+    "against high-precision harmonic numbers.",
+)
+# pylint: disable=too-many-arguments, too-many-locals
 def main(
     start,
     stop,
@@ -129,6 +137,7 @@ def main(
     load,
     save,
     export_to,
+    errors,
 ):
     """
     Generate or load a harmonic sequence and perform summation.
@@ -148,6 +157,7 @@ def main(
         with yaspin(text="Calculating harmonic sums...", color="yellow") as spinner:
             # Ignore overflow errors when operating on NumPy data
             np.seterr(over="ignore")
+            start_time = time.perf_counter()
             sequence_elements = harmonic_sum(
                 start,
                 stop,
@@ -156,8 +166,25 @@ def main(
                 SUMMATION_ALGORITHMS[summation_algorithm],
                 DATA_TYPES[data_type],
             )
+            elapsed_time = time.perf_counter() - start_time
             spinner.ok("✅")
 
+        click.echo(
+            f"Calculated the harmonic sum of {basis}^{stop} terms in "
+            f"{elapsed_time:.3f} s: {sequence_elements[-1]}"
+        )
+        if SUMMATION_ALGORITHMS[summation_algorithm] in ERROR_BOUND_FACTORS:
+            error_bounds = harmonic_sum_error_bounds(
+                start,
+                stop,
+                basis,
+                number_of_terms,
+                SUMMATION_ALGORITHMS[summation_algorithm],
+                sequence_elements,
+                DATA_TYPES[data_type],
+            )
+            click.echo(f"Bound of the summation error: {error_bounds[-1]:.3e}")
+
     if save is not None:
         # Save the generated sequence
         save_data(
@@ -171,15 +198,23 @@ def main(
         )
 
     if display or export_to is not None:
-        plt.figure("Harmonic Sum Convergence", figsize=(10, 6))
+        plt.figure("Harmonic Sum Convergence", figsize=(18, 6) if errors else (10, 6))
+        if errors:
+            plt.subplot(1, 3, 1)
 
         # Plot the generated data
-        plt.loglog(
-            py_logspace(start, stop, number_of_terms),
-            sequence_elements,
-            label=f"{summation_algorithm} summation using {data_type}",
-            marker="o" if number_of_terms <= 100 else "",
-        )
+        sample_points = py_logspace(start, stop, number_of_terms, basis)
+        label = f"{summation_algorithm} summation using {data_type}"
+        marker = "o" if number_of_terms <= 100 else ""
+        plt.loglog(sample_points, sequence_elements, label=label, marker=marker)
+
+        if errors:
+            plt.loglog(
+                sample_points,
+                [float(harmonic_number(point)) for point in sample_points],
+                label="Euler-Maclaurin reference",
+                linestyle="--",
+            )
 
         # Add labels and legend
         plt.xlabel("Number of Terms (log scale)")
@@ -187,6 +222,25 @@ def main(
         plt.title("Harmonic Series Summation Convergence")
         plt.legend()
 
+        if errors:
+            # Plot the errors against the reference next to the sums
+            for index, (kind, sum_errors) in enumerate(
+                zip(
+                    ["Absolute", "Relative"],
+                    harmonic_sum_errors(
+                        start, stop, basis, number_of_terms, sequence_elements
+                    ),
+                ),
+                start=2,
+            ):
+                plt.subplot(1, 3, index)
+                plt.loglog(sample_points, sum_errors, label=label, marker=marker)
+                plt.xlabel("Number of Terms (log scale)")
+                plt.ylabel(f"{kind} Error (log scale)")
+                plt.title(f"{kind} Error of the Harmonic Sum")
+                plt.legend()
+            plt.tight_layout()
+
         if export_to:
             plt.savefig(export_to)
         if display:
@@ -0,0 +1,138 @@
+"""
+This module provides a high-precision reference for harmonic numbers, to measure the
+errors of harmonic sums computed in floating-point arithmetic.
+
+Instead of summing the terms, the n-th harmonic number is evaluated by its
+Euler-Maclaurin expansion
+
+    H_n = ln(n) + γ + 1/(2n) - Σ_k B_2k / (2k n^2k),
+
+where B_2k are the Bernoulli numbers. The expansion diverges, but its terms first
+shrink rapidly, and the error of truncating it is bounded by the first omitted term.
+So each harmonic number only costs a logarithm and a few terms, no matter how large
+n is. Small harmonic numbers, for which the expansion does not reach the precision,
+are summed directly.
+
+Usage Examples:
+---------------
+
+Example usage of `harmonic_number`:
+
+    # Calculate the 10^12-th harmonic number to 30 significant digits
+    print(harmonic_number(10**12))
+
+Example usage of `harmonic_sum_errors`:
+
+    # Calculate the errors of harmonic sums calculated using forward summation
+    sums = harmonic_sum(0, 5, 10, 10, forward_sum, np.float32)
+    absolute_errors, relative_errors = harmonic_sum_errors(0, 5, 10, 10, sums)
+"""
+
+import decimal
+from decimal import Decimal
+from fractions import Fraction
+from functools import cache
+
+from ewr_so_se_2024.harmonic_series.py_logspace import py_logspace
+
+# The Euler-Mascheroni constant γ to 100 decimal places
+EULER_GAMMA = Decimal(
+    "0.57721566490153286060651209008240243104215933593992"
+    "35988057672348848677267776646709369470632917467495"
+)
+# Additional digits carried by the calculations
+GUARD_DIGITS = 5
+# The largest harmonic number which is summed directly
+DIRECT_SUM_LIMIT = 1000
+# The largest number of terms of the expansion
+MAX_EXPANSION_TERMS = 60
+
+
+@cache
+def bernoulli_numbers(count: int) -> tuple[Fraction, ...]:
+    """
+    Calculates the Bernoulli numbers B_2, B_4, ..., B_2count.
+
+    Uses the Akiyama-Tanigawa algorithm on exact fractions.
+
+    Args:
+        count: The number of Bernoulli numbers of even index.
+
+    Returns:
+        The Bernoulli numbers, starting with B_2 = 1/6.
+    """
+    row: list[Fraction] = []
+    numbers = []
+    for m in range(2 * count + 1):
+        row.append(Fraction(1, m + 1))
+        for j in range(m, 0, -1):
+            row[j - 1] = j * (row[j - 1] - row[j])
+        if m > 0 and m % 2 == 0:
+            numbers.append(row[0])
+    return tuple(numbers)
+
+
+def harmonic_number(n: int, precision: int = 30) -> Decimal:
+    """
+    Calculates the n-th harmonic number H_n = 1 + 1/2 + ... + 1/n.
+
+    Args:
+        n: The number of terms.
+        precision: The number of significant digits of the result, at most 95.
+
+    Returns:
+        The harmonic number, correct up to the last digit.
+
+    Raises:
+        ValueError: If the precision exceeds the precision of `EULER_GAMMA`.
+    """
+    if precision + GUARD_DIGITS > 100:
+        raise ValueError(f"Precision too high: {precision} > {100 - GUARD_DIGITS}")
+
+    with decimal.localcontext(prec=precision + GUARD_DIGITS):
+        if n <= DIRECT_SUM_LIMIT:
+            total = sum((1 / Decimal(k) for k in range(1, n + 1)), Decimal(0))
+        else:
+            total = Decimal(n).ln() + EULER_GAMMA + 1 / Decimal(2 * n)
+            tolerance = total.scaleb(-precision - GUARD_DIGITS)
+            n_squared = Decimal(n) ** 2
+            power = n_squared
+            for k, bernoulli in enumerate(
+                bernoulli_numbers(MAX_EXPANSION_TERMS), start=1
+            ):
+                term = Decimal(bernoulli.numerator) / (
+                    Decimal(bernoulli.denominator) * 2 * k * power
+                )
+                total -= term
+                if abs(term) < tolerance:
+                    break
+                power *= n_squared
+
+    with decimal.localcontext(prec=precision):
+        return +total
+
+
+def harmonic_sum_errors(
+    logspace_start, logspace_stop, logspace_basis, n: int, partial_sums: list
+) -> tuple[list[float], list[float]]:
+    """
+    Calculates the errors of the harmonic sums calculated by `harmonic_sum`.
+
+    Args:
+        n: The number of logarithmically spaced terms the harmonic series was
+           sampled at.
+        partial_sums: The harmonic sums calculated by `harmonic_sum`.
+
+    Returns:
+        The absolute and the relative errors of the harmonic sums.
+    """
+    absolute_errors = []
+    relative_errors = []
+    for number_of_terms, partial_sum in zip(
+        py_logspace(logspace_start, logspace_stop, n, logspace_basis), partial_sums
+    ):
+        reference = harmonic_number(number_of_terms)
+        error = abs(Decimal(float(partial_sum)) - reference)
+        absolute_errors.append(float(error))
+        relative_errors.append(float(error / reference))
+    return absolute_errors, relative_errors
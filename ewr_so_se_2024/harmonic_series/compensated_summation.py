@@ -0,0 +1,351 @@
+"""
+This module provides block-vectorized summation methods for harmonic sums, which
+are more accurate than forward summation, together with bounds on their errors.
+
+All methods take the same arguments as the methods of `harmonic_convergence`. They
+compute the terms in NumPy blocks and only carry their state, such as a
+compensation, from one block to the next:
+
+- `neumaier_sum`: Kahan-Babuška summation as improved by Neumaier, run on many
+  lanes side by side, whose sums and compensations are combined exactly at the end.
+- `pairwise_sum`: Pairwise summation of every block, followed by pairwise summation
+  of the sums of the blocks.
+- `exact_sum`: The exactly rounded sum, based on `math.fsum`.
+
+The error bounds cover the summation itself, i.e. they bound the distance of the
+computed sum to the exact sum of the computed terms. Since the terms of the
+harmonic series are positive, the sum of their magnitudes is the sum itself, so the
+bounds are relative to the computed sums.
+
+Usage Examples:
+---------------
+
+Example usage of `neumaier_sum`:
+
+    # Calculate the sum of the first 10^6 terms
+    print(neumaier_sum(np.float32(0), 0, 10**6, np.float32))
+
+Example usage of `harmonic_sum_error_bounds`:
+
+    # Bound the errors of harmonic sums calculated using pairwise summation
+    sums = harmonic_sum(0, 5, 10, 10, pairwise_sum, np.float32)
+    print(harmonic_sum_error_bounds(0, 5, 10, 10, pairwise_sum, sums, np.float32))
+"""
+
+import math
+from itertools import chain, pairwise
+from typing import Any, Callable, Iterator, TypeVar, cast
+
+import numpy as np
+
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
+    forward_sum,
+    harmonic_terms,
+    kahan_sum,
+)
+from ewr_so_se_2024.harmonic_series.py_logspace import py_logspace
+
+# Type hint for type checking (only used for static type checkers)
+T = TypeVar("T", bound=np.floating[Any])
+
+# The number of lanes on which Neumaier summation runs side by side
+NEUMAIER_LANES = 1024
+# The unit roundoff of double precision, in which the lanes are combined
+DOUBLE_UNIT_ROUNDOFF = float(np.finfo(np.float64).eps) / 2
+# The number of terms computed at once
+BLOCK_SIZE = 2**18
+
+
+def neumaier_sum(
+    partial_sum: T,
+    start: int,
+    stop: int,
+    dtype: type[T] = np.float32,
+    lanes: int = NEUMAIER_LANES,
+) -> T:
+    """
+    Calculates the n-th harmonic sum using Kahan-Babuška-Neumaier summation.
+
+    The terms are dealt out to `lanes` running sums, each with a compensation of
+    its own, so every step of the summation is a vectorized operation. At the end,
+    the running sums and their compensations are summed exactly by `math.fsum` and
+    rounded to the data type, which must not be wider than double precision. Summing
+    thousands of them in a narrow data type such as float16 would lose more than the
+    compensations gained.
+
+    Args:
+        partial_sum: The sum of the terms before the first one.
+        start: The number of terms before the first one.
+        stop: The index of the last term.
+        dtype: Data type of the summands. Default is np.float32.
+        lanes: The number of running sums.
+
+    Returns:
+        The n-th harmonic sum.
+    """
+    if start >= stop:
+        return partial_sum
+
+    sums = np.zeros(lanes, dtype=dtype)
+    sums[0] = partial_sum
+    compensations = np.zeros(lanes, dtype=dtype)
+    block_size = BLOCK_SIZE - BLOCK_SIZE % lanes or lanes
+    for block_start in range(start, stop, block_size):
+        terms = harmonic_terms(block_start, min(block_start + block_size, stop), dtype)
+        # Pad the last row with zeros, which are added exactly
+        rows = np.zeros(-(-terms.size // lanes) * lanes, dtype=dtype)
+        rows[: terms.size] = terms
+        for row in rows.reshape(-1, lanes):
+            new_sums = sums + row
+            compensations += np.where(
+                np.abs(sums) >= np.abs(row),
+                (sums - new_sums) + row,
+                (row - new_sums) + sums,
+            )
+            sums = new_sums
+
+    return cast(T, dtype(math.fsum(chain(sums.tolist(), compensations.tolist()))))
+
+
+def pairwise_reduce(values: np.ndarray) -> np.floating:
+    """
+    Sums values by adding neighbouring pairs until a single value is left.
+
+    Every value takes part in at most ceil(log2(n)) additions for n values.
+
+    Args:
+        values: The values to sum.
+
+    Returns:
+        The sum of the values, in their data type.
+    """
+    if values.size == 0:
+        return values.dtype.type(0)
+    while values.size > 1:
+        if values.size % 2 == 1:
+            values = np.append(values, values.dtype.type(0))
+        values = values[0::2] + values[1::2]
+    return values[0]
+
+
+def pairwise_sum(
+    partial_sum: T,
+    start: int,
+    stop: int,
+    dtype: type[T] = np.float32,
+    block_size: int = BLOCK_SIZE,
+) -> T:
+    """
+    Calculates the n-th harmonic sum using blocked pairwise summation.
+
+    The terms of every block are summed pairwise. The sums of the blocks are kept,
+    and summed pairwise together with the given partial sum at the end.
+
+    Args:
+        partial_sum: The sum of the terms before the first one.
+        start: The number of terms before the first one.
+        stop: The index of the last term.
+        dtype: Data type of the summands. Default is np.float32.
+        block_size: The number of terms summed at once.
+
+    Returns:
+        The n-th harmonic sum.
+    """
+    block_sums = [partial_sum] + [
+        pairwise_reduce(
+            harmonic_terms(block_start, min(block_start + block_size, stop), dtype)
+        )
+        for block_start in range(start, stop, block_size)
+    ]
+    return cast(T, pairwise_reduce(np.array(block_sums, dtype=dtype)))
+
+
+def exact_sum(
+    partial_sum: T,
+    start: int,
+    stop: int,
+    dtype: type[T] = np.float32,
+    block_size: int = BLOCK_SIZE,
+) -> T:
+    """
+    Calculates the n-th harmonic sum, exactly rounded to the data type.
+
+    `math.fsum` rounds the exact sum of the terms to a double exactly. Rounding that
+    double to a narrower data type again only differs from rounding the exact sum
+    if the double lies exactly halfway between two values of the data type. Then
+    the remainder of the exact sum decides the direction.
+
+    Args:
+        partial_sum: The sum of the terms before the first one.
+        start: The number of terms before the first one.
+        stop: The index of the last term.
+        dtype: Data type of the summands. Default is np.float32.
+        block_size: The number of terms computed at once.
+
+    Returns:
+        The n-th harmonic sum.
+    """
+
+    def values() -> Iterator[float]:
+        yield float(partial_sum)
+        for block_start in range(start, stop, block_size):
+            yield from harmonic_terms(
+                block_start, min(block_start + block_size, stop), dtype
+            ).tolist()
+
+    total = math.fsum(values())
+    rounded = dtype(total)
+    if not np.isfinite(rounded) or float(rounded) == total:
+        return cast(T, rounded)
+
+    neighbour = np.nextafter(rounded, dtype(math.copysign(np.inf, total - rounded)))
+    if total == (float(rounded) + float(neighbour)) / 2:
+        remainder = math.fsum(chain(values(), [-total]))
+        if remainder != 0 and (remainder > 0) == (neighbour > rounded):
+            rounded = neighbour
+    return cast(T, rounded)
+
+
+def pairwise_depth(number_of_terms: int, block_size: int = BLOCK_SIZE) -> int:
+    """
+    Calculates the number of additions any value takes part in during `pairwise_sum`.
+
+    Args:
+        number_of_terms: The number of terms summed.
+        block_size: The number of terms summed at once.
+
+    Returns:
+        The depth of the summation tree.
+    """
+    number_of_blocks = -(-number_of_terms // block_size)
+    return math.ceil(math.log2(max(min(block_size, number_of_terms), 1))) + math.ceil(
+        math.log2(number_of_blocks + 1)
+    )
+
+
+def gamma(n: int, unit_roundoff: float) -> float:
+    """
+    Calculates the factor n u / (1 - n u) bounding the error of n roundings.
+
+    Args:
+        n: The number of roundings.
+        unit_roundoff: The unit roundoff u of the data type.
+
+    Returns:
+        The factor, or infinity if n u is not less than one.
+    """
+    return (
+        n * unit_roundoff / (1 - n * unit_roundoff) if n * unit_roundoff < 1 else np.inf
+    )
+
+
+def neumaier_error_bound_factor(
+    number_of_terms: int, unit_roundoff: float, lanes: int = NEUMAIER_LANES
+) -> float:
+    """
+    Calculates the factor bounding the error of `neumaier_sum`.
+
+    Every lane adds r = ceil(m / lanes) rows of the m terms. The error of each
+    addition is computed exactly, and it is at most u times the running sum of the
+    lane, which is at most (1 + gamma(r)) times the exact sum of the lane for the
+    positive terms of the harmonic series. It is also at most the added term.
+    Accumulating these errors in the compensation adds at most gamma(r - 1) times
+    their total, which is the error of the lane. Combining the lanes exactly in
+    double precision and rounding the result to the data type adds at most
+    u + u_double (1 + u). Unlike the usual 2u + O(m u^2), the factor holds for any
+    m u, and it is infinite once gamma(r - 1) is.
+
+    Args:
+        number_of_terms: The number of terms summed.
+        unit_roundoff: The unit roundoff u of the data type.
+        lanes: The number of running sums.
+
+    Returns:
+        The factor bounding the error relative to the sum.
+    """
+    rows = -(-number_of_terms // lanes)
+    lane_factor = gamma(max(rows - 1, 0), unit_roundoff) * min(
+        rows * unit_roundoff * (1 + gamma(rows, unit_roundoff)), 1
+    )
+    rounding = unit_roundoff + DOUBLE_UNIT_ROUNDOFF * (1 + unit_roundoff)
+    return lane_factor + rounding * (1 + lane_factor)
+
+
+# Factors f(m, u) with which the error of summing m terms and a partial sum is at
+# most f(m, u) times the sum of their magnitudes, given the unit roundoff u
+ERROR_BOUND_FACTORS: dict[Callable, Callable[[int, float], float]] = {
+    forward_sum: gamma,
+    kahan_sum: lambda m, u: 2 * u + 4 * m * u**2,
+    neumaier_sum: neumaier_error_bound_factor,
+    pairwise_sum: lambda m, u: gamma(pairwise_depth(m), u),
+    exact_sum: lambda m, u: u,
+}
+
+
+def error_bound(
+    summation_algorithm: Callable,
+    computed_sum: float,
+    number_of_terms: int,
+    dtype: type[T] = np.float32,
+) -> float:
+    """
+    Bounds the error of a single call to a summation method.
+
+    The factor of the method bounds the error relative to the exact sum. Since the
+    exact sum differs from the computed one by at most the error, the error is at
+    most f |computed sum| / (1 - f).
+
+    Args:
+        summation_algorithm: The summation method, one of `ERROR_BOUND_FACTORS`.
+        computed_sum: The sum computed by the method.
+        number_of_terms: The number of terms summed by the method.
+        dtype: Data type of the summands.
+
+    Returns:
+        The bound of the absolute error.
+    """
+    factor = ERROR_BOUND_FACTORS[summation_algorithm](
+        number_of_terms, float(np.finfo(dtype).eps) / 2
+    )
+    return factor * abs(computed_sum) / (1 - factor) if factor < 1 else np.inf
+
+
+# pylint: disable=too-many-arguments
+def harmonic_sum_error_bounds(
+    logspace_start,
+    logspace_stop,
+    logspace_basis,
+    n: int,
+    summation_algorithm,
+    partial_sums: list,
+    dtype: type[T] = np.float32,
+) -> list[float]:
+    """
+    Bounds the errors of the harmonic sums calculated by `harmonic_sum`.
+
+    Every sum carries the error of the previous one, plus the error of the call
+    which added the terms in between.
+
+    Args:
+        n: The number of logarithmically spaced terms the harmonic series was
+           sampled at.
+        summation_algorithm: The summation method, one of `ERROR_BOUND_FACTORS`.
+        partial_sums: The harmonic sums calculated by `harmonic_sum`.
+        dtype: Data type of the summands.
+
+    Returns:
+        The bound of the absolute error of every harmonic sum.
+    """
+    bounds = []
+    bound = 0.0
+    for (start, stop), partial_sum in zip(
+        pairwise(
+            chain([0], py_logspace(logspace_start, logspace_stop, n, logspace_basis))
+        ),
+        partial_sums,
+    ):
+        bound += error_bound(
+            summation_algorithm, float(partial_sum), max(stop - start, 0), dtype
+        )
+        bounds.append(bound)
+    return bounds
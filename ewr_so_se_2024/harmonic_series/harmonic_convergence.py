@@ -15,9 +15,8 @@ Example usage of `harmonic_sum`:
     print(harmonic_sum(5, forward_sum, np.float32))
 """
 
-from functools import reduce
 from itertools import accumulate, chain, islice, pairwise
-from typing import Any, cast, TypeVar
+from typing import Any, Iterator, cast, TypeVar
 
 import numpy as np
 
@@ -27,31 +26,90 @@ from ewr_so_se_2024.harmonic_series.py_logspace import py_logspace
 # Type hint for type checking (only used for static type checkers)
 T = TypeVar("T", bound=np.floating[Any])
 
+# The number of terms processed at once by the chunked summation methods
+CHUNK_SIZE = 2**16
+
+
+def harmonic_term_chunks(
+    start: int, stop: int, dtype: type[T] = np.float32, chunk_size: int = CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Calculates the terms 1/k of the harmonic series in chunks of a fixed size.
+
+    All chunks are views of the same preallocated buffer, so the memory does not
+    depend on the number of terms. Each chunk starts with a free slot, which is
+    meant for the partial sum carried over from the previous chunk, followed by up
+    to `chunk_size` terms. A chunk is overwritten by the next one.
+
+    Args:
+        start: The number of terms before the first one.
+        stop: The index of the last term.
+        dtype: Data type of the summands. Default is np.float32.
+        chunk_size: The maximum number of terms of a chunk.
+
+    Yields:
+        The free slot and the terms of each chunk.
+    """
+    indices = np.arange(
+        start + 1, start + min(chunk_size, stop - start) + 1, dtype=np.int64
+    )
+    buffer = np.empty(indices.size + 1, dtype=dtype)
+    for chunk_start in range(start, stop, chunk_size):
+        chunk = buffer[: min(chunk_size, stop - chunk_start) + 1]
+        # Every index is rounded to the data type before dividing, like `dtype(k)`
+        chunk[1:] = indices[: chunk.size - 1]
+        np.divide(dtype(1), chunk[1:], out=chunk[1:])
+        yield chunk
+        indices += chunk_size
+
+
+def harmonic_terms(start: int, stop: int, dtype: type[T] = np.float32) -> np.ndarray:
+    """
+    Calculates the terms 1/k of the harmonic series for k from start + 1 up to stop.
+
+    Every index is rounded to the data type before dividing, just like `dtype(k)`.
+
+    Args:
+        start: The number of terms before the first one.
+        stop: The index of the last term.
+        dtype: Data type of the summands. Default is np.float32.
+
+    Returns:
+        The terms as an array of the data type.
+    """
+    return dtype(1) / np.arange(start + 1, stop + 1, dtype=np.int64).astype(dtype)
+
 
 def vectorized_sum(
     partial_sum: T,
     start: int,
     stop: int,
     dtype: type[T] = np.float32,
+    chunk_size: int = CHUNK_SIZE,
 ) -> T:
     """
     Calculates the n-th harmonic sum using vectorization.
 
+    The terms are summed in chunks of `chunk_size` terms, each of which is summed
+    by `np.sum` together with the partial sum carried over from the previous chunk,
+    placed in front of its terms. Within a chunk, the summation order is that of
+    NumPy's pairwise summation, across chunks it is from left to right. The result
+    thus only depends on the chunk size, not on the available memory.
+
     Args:
-        n: Number of terms in the harmonic sum.
+        partial_sum: The sum of the terms before the first one.
+        start: The number of terms before the first one.
+        stop: The index of the last term.
         dtype: Data type of the summands. Default is np.float32.
+        chunk_size: The number of terms summed at once.
 
     Returns:
         The n-th harmonic sum.
     """
-    return cast(
-        T,
-        np.sum(
-            np.concatenate(
-                ([partial_sum], dtype(1) / np.arange(start + 1, stop + 1, dtype=dtype))
-            )
-        ),
-    )
+    for chunk in harmonic_term_chunks(start, stop, dtype, chunk_size):
+        chunk[0] = partial_sum
+        partial_sum = cast(T, np.sum(chunk))
+    return partial_sum
 
 
 def forward_sum(
@@ -59,25 +117,31 @@ def forward_sum(
     start: int,
     stop: int,
     dtype: type[T] = np.float32,
+    chunk_size: int = CHUNK_SIZE,
 ) -> T:
     """
     Calculates the n-th harmonic sum using forward summation method.
 
+    The terms are added one after another in the data type, in chunks of
+    `chunk_size` terms. `np.add.accumulate` adds sequentially from left to right,
+    so seeding each chunk with the partial sum carried over from the previous one
+    rounds exactly like adding the terms in a Python loop.
+
     Args:
-        n: Number of terms in the harmonic sum.
+        partial_sum: The sum of the terms before the first one.
+        start: The number of terms before the first one.
+        stop: The index of the last term.
         dtype: Data type of the summands. Default is np.float32.
+        chunk_size: The number of terms added at once.
 
     Returns:
         The n-th harmonic sum.
     """
-    return cast(
-        T,
-        reduce(
-            lambda partial_sum, n: partial_sum + dtype(1) / dtype(n),
-            range(start + 1, stop + 1),
-            partial_sum,
-        ),
-    )
+    for chunk in harmonic_term_chunks(start, stop, dtype, chunk_size):
+        chunk[0] = partial_sum
+        np.add.accumulate(chunk, out=chunk)
+        partial_sum = cast(T, chunk[-1])
+    return partial_sum
 
 
 def kahan_sum(partial_sum: T, start: int, stop: int, dtype: type[T] = np.float32) -> T:
@@ -0,0 +1,315 @@
+"""
+This module provides a command-line interface (CLI) for sweeping over combinations of
+data types and summation algorithms. Every combination calculates the harmonic sums at
+the same logarithmically spaced numbers of terms. The combinations are independent of
+each other, so they run in a pool of worker processes, which report their progress
+after every logspace segment through a shared queue. All curves are plotted into one
+figure and all results are written to one JSON file, together with their errors
+against the high-precision reference of `asymptotic`.
+
+Usage Examples:
+---------------
+
+Sweep over all data types and the Forward and Neumaier summation algorithms:
+
+    harmonic-series-sweep --stop 8 -a Forward -a Neumaier -o sweep.json
+
+Sweep over all combinations using four worker processes, plotting the errors:
+
+    harmonic-series-sweep --stop 9 --jobs 4 --errors --export-to sweep.png
+"""
+
+import json
+import os
+import queue
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import product
+from multiprocessing import Manager
+from typing import Optional
+
+import click
+import matplotlib.pyplot as plt
+import numpy as np
+from tqdm import tqdm
+
+from ewr_so_se_2024.harmonic_series.asymptotic import harmonic_sum_errors
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import harmonic_sum
+from ewr_so_se_2024.harmonic_series.py_logspace import py_logspace
+from ewr_so_se_2024.harmonic_series.utils import DATA_TYPES, SUMMATION_ALGORITHMS
+
+# The version of the results file format
+VERSION = 1
+# The line styles distinguishing the data types in the plot
+LINE_STYLES = {"float16": ":", "float32": "--", "float64": "-"}
+# The number of seconds between two updates of the progress bar
+PROGRESS_INTERVAL = 0.1
+
+
+# pylint: disable=too-many-arguments
+def sweep_combination(
+    start: int,
+    stop: int,
+    basis: int,
+    number_of_terms: int,
+    data_type: str,
+    summation_algorithm: str,
+    progress: Optional[queue.Queue] = None,
+) -> tuple[list[float], float]:
+    """
+    Calculates the harmonic sums of a single combination.
+
+    Args:
+        start: The starting exponent of the logspace.
+        stop: The ending exponent of the logspace.
+        basis: The base of the logspace.
+        number_of_terms: The number of logarithmically spaced terms.
+        data_type: The name of the data type, one of `DATA_TYPES`.
+        summation_algorithm: The name of the summation algorithm, one of
+                             `SUMMATION_ALGORITHMS`.
+        progress: A queue, which receives a 1 after every summed logspace segment.
+
+    Returns:
+        The harmonic sums and the number of seconds it took to calculate them.
+    """
+    algorithm = SUMMATION_ALGORITHMS[summation_algorithm]
+
+    def sum_segment(partial_sum, segment_start, segment_stop, dtype):
+        partial_sum = algorithm(partial_sum, segment_start, segment_stop, dtype=dtype)
+        if progress is not None:
+            progress.put(1)
+        return partial_sum
+
+    start_time = time.perf_counter()
+    # Ignore overflow errors when operating on NumPy data
+    with np.errstate(over="ignore"):
+        sums = harmonic_sum(
+            start,
+            stop,
+            basis,
+            number_of_terms,
+            sum_segment,
+            DATA_TYPES[data_type],
+        )
+    return list(map(float, sums)), time.perf_counter() - start_time
+
+
+@click.command(context_settings={"show_default": True})
+@click.option(
+    "--start",
+    type=click.IntRange(min=0, max=12),
+    default=0,
+    help="The starting exponent for calculating the logspace (base ^ start).",
+)
+@click.option(
+    "--stop",
+    type=click.IntRange(min=1, max=12),
+    default=5,
+    help="The ending exponent for calculating the logspace (base ^ stop).",
+)
+@click.option(
+    "--basis",
+    type=click.IntRange(min=2),
+    default=10,
+    help="The base for the logspace calculation.",
+)
+@click.option(
+    "-n",
+    "--number-of-terms",
+    type=click.IntRange(min=2),
+    default=20,
+    help="Number of terms to sample the harmonic series at.",
+)
+@click.option(
+    "-t",
+    "--data-type",
+    "data_types",
+    type=click.Choice(list(DATA_TYPES.keys())),
+    default=list(DATA_TYPES.keys()),
+    multiple=True,
+    help="The data type(s) to use for summing.",
+)
+@click.option(
+    "-a",
+    "--summation-algorithm",
+    "summation_algorithms",
+    type=click.Choice(list(SUMMATION_ALGORITHMS.keys()), case_sensitive=False),
+    default=list(SUMMATION_ALGORITHMS.keys()),
+    multiple=True,
+    help="The algorithm(s) to use for summation.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    help="The number of worker processes.",
+)
+@click.option(
+    "--errors/--no-errors",
+    default=False,
+    help="Plot the absolute and relative errors of the sums next to them.",
+)
+@click.option(
+    "--display/--no-display",
+    default=True,
+    help="Display the plot of the results.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the results to a specified JSON file.",
+)
+@click.option(
+    "--export-to",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Export the generated plot to a specified file.",
+)
+# pylint: disable=too-many-arguments, too-many-locals
+def sweep(
+    start,
+    stop,
+    basis,
+    number_of_terms,
+    data_types,
+    summation_algorithms,
+    jobs,
+    errors,
+    display,
+    output,
+    export_to,
+):
+    """
+    Calculate harmonic sums for every combination of data type and summation
+    algorithm in parallel.
+    """
+    combinations = list(
+        product(dict.fromkeys(data_types), dict.fromkeys(summation_algorithms))
+    )
+    sample_points = py_logspace(start, stop, number_of_terms, basis)
+    results = {}
+    with Manager() as manager, ProcessPoolExecutor(
+        min(jobs, len(combinations))
+    ) as executor, tqdm(
+        total=len(combinations) * len(sample_points), desc="Sweeping segments"
+    ) as progress_bar:
+        progress = manager.Queue()
+        futures = {
+            executor.submit(
+                sweep_combination,
+                start,
+                stop,
+                basis,
+                number_of_terms,
+                data_type,
+                summation_algorithm,
+                progress,
+            ): (data_type, summation_algorithm)
+            for data_type, summation_algorithm in combinations
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                results[futures[future]] = future.result()
+            try:
+                while True:
+                    progress_bar.update(progress.get_nowait())
+            except queue.Empty:
+                pass
+    combination_results = []
+    for data_type, summation_algorithm in combinations:
+        sums, elapsed_time = results[data_type, summation_algorithm]
+        absolute_errors, relative_errors = harmonic_sum_errors(
+            start, stop, basis, number_of_terms, sums
+        )
+        click.echo(
+            f"{summation_algorithm} summation using {data_type}: {sums[-1]} "
+            f"(relative error {relative_errors[-1]:.3e}) in {elapsed_time:.3f} s"
+        )
+        combination_results.append(
+            {
+                "data_type": data_type,
+                "summation_algorithm": summation_algorithm,
+                "elapsed_time": elapsed_time,
+                "sums": sums,
+                "absolute_errors": absolute_errors,
+                "relative_errors": relative_errors,
+            }
+        )
+
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {
+                    "version": VERSION,
+                    "parameters": {
+                        "start": start,
+                        "stop": stop,
+                        "basis": basis,
+                        "number_of_terms": number_of_terms,
+                    },
+                    "sample_points": sample_points,
+                    "results": combination_results,
+                },
+                output_file,
+                indent=4,
+            )
+
+    if display or export_to is not None:
+        plot_results(sample_points, combination_results, errors)
+        if export_to:
+            plt.savefig(export_to)
+        if display:
+            plt.show()
+
+
+def plot_results(sample_points: list, combination_results: list, errors: bool):
+    """
+    Plots the sums, and optionally their errors, of all combinations into one figure.
+
+    Algorithms are distinguished by color, data types by line style.
+
+    Args:
+        sample_points: The numbers of terms the harmonic series was sampled at.
+        combination_results: The results of every combination.
+        errors: Whether to plot the absolute and relative errors next to the sums.
+    """
+    plt.figure("Harmonic Sum Sweep", figsize=(18, 6) if errors else (10, 6))
+    panels = [("sums", "Harmonic Sum", "Harmonic Series Summation Convergence")]
+    if errors:
+        panels += [
+            (f"{kind.lower()}_errors", f"{kind} Error", f"{kind} Error of the Sums")
+            for kind in ["Absolute", "Relative"]
+        ]
+
+    colors = {}
+    for index, (key, ylabel, title) in enumerate(panels, start=1):
+        plt.subplot(1, len(panels), index)
+        for result in combination_results:
+            color = colors.setdefault(
+                result["summation_algorithm"], f"C{len(colors) % 10}"
+            )
+            plt.loglog(
+                sample_points,
+                result[key],
+                label=f"{result['summation_algorithm']} summation using "
+                f"{result['data_type']}",
+                color=color,
+                linestyle=LINE_STYLES[result["data_type"]],
+            )
+        plt.xlabel("Number of Terms (log scale)")
+        plt.ylabel(f"{ylabel} (log scale)")
+        plt.title(title)
+    # The panels share their curves, so a single legend covers all of them
+    plt.subplot(1, len(panels), 1)
+    plt.legend(fontsize="small")
+    plt.tight_layout()
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    sweep()
@@ -1,9 +1,34 @@
 """
 This module contains utility functions and classes for command-line interface (CLI) options 
-and Matplotlib compatibility adjustments.
+and Matplotlib compatibility adjustments, together with the summation algorithms and
+data types selectable by the CLIs.
 """
 
 import click
+import numpy as np
+
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
+    forward_sum,
+    kahan_sum,
+    vectorized_sum,
+)
+from ewr_so_se_2024.harmonic_series.compensated_summation import (
+    exact_sum,
+    neumaier_sum,
+    pairwise_sum,
+)
+
+
+# Define available summation algorithms and data types
+SUMMATION_ALGORITHMS = {
+    "Forward": forward_sum,
+    "Kahan": kahan_sum,
+    "Vectorized": vectorized_sum,
+    "Neumaier": neumaier_sum,
+    "Pairwise": pairwise_sum,
+    "Exact": exact_sum,
+}
+DATA_TYPES = {"float16": np.float16, "float32": np.float32, "float64": np.float64}
 
 
 class NotRequiredIf(click.Option):
@@ -0,0 +1,23 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import pytest
+
+from ewr_so_se_2024.approximation_of_pi.reference import PI_REFERENCE
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    """Keeps the reference digits and cached results of every test in `tmp_path`."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        PI_REFERENCE,
+        "store_path",
+        str(tmp_path / "cache" / "ewr_so_se_2024" / "pi-digits.bcd"),
+    )
+    monkeypatch.setattr(PI_REFERENCE, "_mapping", None)
+    monkeypatch.setattr(PI_REFERENCE, "_unpacked", b"")
+    yield
+    if PI_REFERENCE._mapping is not None:  # pylint: disable=protected-access
+        PI_REFERENCE._mapping.close()  # pylint: disable=protected-access
@@ -0,0 +1,42 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+from decimal import Decimal
+
+import numpy as np
+
+from ewr_so_se_2024.harmonic_series.asymptotic import (
+    DIRECT_SUM_LIMIT,
+    harmonic_number,
+    harmonic_sum_errors,
+)
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
+    forward_sum,
+    harmonic_sum,
+)
+
+
+def test_harmonic_number():
+    assert harmonic_number(1) == 1
+    assert harmonic_number(4, 10) == Decimal("2.083333333")
+    for n in [DIRECT_SUM_LIMIT + 1, 12345]:
+        with decimal.localcontext(prec=100):
+            direct_sum = sum((1 / Decimal(k) for k in range(1, n + 1)), Decimal(0))
+        with decimal.localcontext(prec=90):
+            assert harmonic_number(n, 90) == +direct_sum
+
+
+# Indices beyond the range of float16 overflow to infinity, leaving terms of zero
+@np.errstate(over="ignore")
+def test_harmonic_sum_errors():
+    sums = harmonic_sum(0, 4, 10, 5, forward_sum, np.float64)
+    absolute_errors, relative_errors = harmonic_sum_errors(0, 4, 10, 5, sums)
+    assert absolute_errors[0] == 0
+    assert max(relative_errors) < 1e-14
+
+    sums = harmonic_sum(0, 7, 10, 5, forward_sum, np.float16)
+    absolute_errors, relative_errors = harmonic_sum_errors(0, 7, 10, 5, sums)
+    assert relative_errors[-1] > 0.5
+    assert absolute_errors[-1] == relative_errors[-1] * float(harmonic_number(10**7))
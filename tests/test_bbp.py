@@ -0,0 +1,22 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+
+from ewr_so_se_2024.approximation_of_pi import bbp, utils
+from ewr_so_se_2024.approximation_of_pi.sequences import Chudnovsky
+
+
+def test_pi_hex_digits():
+    assert bbp.pi_hex_digits(0, 16) == "243F6A8885A308D3"
+
+    with decimal.localcontext(prec=500):
+        number_of_digits = bbp.trusted_hex_digits(500)
+        reference_digits = bbp.hex_digits_of(+utils.PI, 0, number_of_digits)
+        for position in [1, 7, 100, number_of_digits - 8]:
+            assert bbp.pi_hex_digits(position) == reference_digits[position:][:8]
+
+        assert bbp.hex_digits_of(Chudnovsky().at(100), 0, 100) == reference_digits[:100]
+
+    assert bbp.pi_hex_digits_in_parallel(3, 40, 3) == reference_digits[3:43]
@@ -0,0 +1,63 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+from decimal import Decimal
+
+from click.testing import CliRunner
+
+from ewr_so_se_2024.approximation_of_pi import benchmark, fixed_point
+from ewr_so_se_2024.approximation_of_pi.sequences import Chudnovsky
+
+
+def test_results_round_trip(tmp_path):
+    results = {
+        "decimal/Chudnovsky/50": benchmark.benchmark_sequence(Chudnovsky, 50, 10, 3, 1)
+    }
+    assert results["decimal/Chudnovsky/50"]["digits_per_second"] > 0
+
+    benchmark.save_results(tmp_path / "results.json", results)
+    assert benchmark.load_results(tmp_path / "results.json") == results
+
+
+def test_invalid_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    for content, message in [
+        ("{", "Expecting property name"),
+        ("[]", "expected a JSON object"),
+        ('{"version": 0, "results": {}}', "Invalid version"),
+        (f'{{"version": {benchmark.VERSION}}}', "Missing 'results'"),
+    ]:
+        baseline.write_text(content, encoding="utf-8")
+        result = CliRunner().invoke(
+            benchmark.main, ["-s", "Leibniz", "-p", "5", "--baseline", str(baseline)]
+        )
+        assert result.exit_code == 1
+        assert f"Error: Cannot load the baseline {baseline}: " in result.output
+        assert message in result.output
+
+
+def test_find_regressions():
+    baseline = {
+        "a": {"next_element_throughput": 100.0, "at_latency": 1.0},
+        "b": {"digits_per_second": 100.0},
+    }
+    results = {
+        "a": {"next_element_throughput": 85.0, "at_latency": 1.5},
+        "b": {"digits_per_second": 70.0},
+        "c": {"digits_per_second": 1.0},
+    }
+    assert benchmark.find_regressions(results, baseline, 0.2) == [
+        ("a", "at_latency", 1.0, 1.5),
+        ("b", "digits_per_second", 100.0, 70.0),
+    ]
+
+
+def test_conversion():
+    value = 7**100_000
+    converted = fixed_point.integer_to_decimal(value)
+    assert converted == Decimal(value)
+    assert fixed_point.integer_to_decimal(-value) == converted.copy_negate()
+
+    metrics = benchmark.benchmark_conversion(5000, 1)
+    assert metrics["conversion_latency"] > 0 and metrics["conversion_speedup"] > 0
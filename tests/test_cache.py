@@ -0,0 +1,28 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+from decimal import Decimal
+
+from ewr_so_se_2024.approximation_of_pi.cache import ResultCache
+
+
+def test_result_cache(tmp_path):
+    result_cache = ResultCache(str(tmp_path / "results.sqlite"), max_entries=3)
+    for position in range(3):
+        result_cache.put("convergence", "Leibniz", "decimal", 50, position, position)
+    assert result_cache.get("convergence", "Leibniz", "integer", 50, 0) is None
+    assert result_cache.get("convergence", "Leibniz", "decimal", 50, 0) == 0
+
+    # The least recently used result is evicted
+    result_cache.put("convergence", "Leibniz", "decimal", 50, 3, (Decimal(3), 1))
+    assert len(result_cache) == 3
+    assert result_cache.get("convergence", "Leibniz", "decimal", 50, 1) is None
+    assert result_cache.get("convergence", "Leibniz", "decimal", 50, 0) == 0
+    assert result_cache.get("convergence", "Leibniz", "decimal", 50, 3) == (
+        Decimal(3),
+        1,
+    )
+
+    disabled_cache = ResultCache(str(tmp_path / "results.sqlite"), enabled=False)
+    assert disabled_cache.get("convergence", "Leibniz", "decimal", 50, 0) is None
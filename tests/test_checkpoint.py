@@ -0,0 +1,57 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+
+import pytest
+
+from ewr_so_se_2024.approximation_of_pi.checkpoint import (
+    Checkpointer,
+    advance_in_chunks,
+    load_checkpoint,
+)
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    Chudnovsky,
+    GaussLegendre,
+    Leibniz,
+)
+
+
+def test_checkpoint_resume(tmp_path):
+    checkpoint_path = str(tmp_path / "run.ckpt")
+    parameters = {"sample_points": [1, 2, 3]}
+
+    with decimal.localcontext(prec=100):
+        checkpointer = Checkpointer(checkpoint_path, 100, parameters, interval=3600)
+        sequence = checkpointer.checkpoint.states["GaussLegendre"] = GaussLegendre()
+        checkpointer.checkpoint.results["GaussLegendre"] = [sequence.at(2)]
+        checkpointer.update()
+        assert not (tmp_path / "run.ckpt").exists()
+        checkpointer.update(force=True)
+
+        resumed = Checkpointer(checkpoint_path, 100, parameters, resume=True)
+        assert resumed.checkpoint.results == checkpointer.checkpoint.results
+        assert next(resumed.checkpoint.states["GaussLegendre"]) == next(sequence)
+
+    with pytest.raises(ValueError, match="precision"):
+        load_checkpoint(checkpoint_path, 50, parameters)
+    with pytest.raises(ValueError, match="parameters"):
+        load_checkpoint(checkpoint_path, 100, {"sample_points": [1, 2]})
+
+
+def test_advance_in_chunks(tmp_path):
+    checkpoint_path = str(tmp_path / "run.ckpt")
+    with decimal.localcontext(prec=300):
+        checkpointer = Checkpointer(checkpoint_path, 300, {}, interval=0)
+        sequence = checkpointer.checkpoint.states["Leibniz"] = Leibniz()
+        assert advance_in_chunks(sequence, 2500, checkpointer, 1000) == (
+            Leibniz().at(2500)
+        )
+
+        # The last checkpoint was saved after the second chunk
+        resumed = load_checkpoint(checkpoint_path, 300, {}).states["Leibniz"]
+        assert resumed.current_position == 1999
+        assert resumed.at(2500) == sequence.current_approximation
+
+        assert advance_in_chunks(Chudnovsky(), 100, None, 7) == Chudnovsky().at(100)
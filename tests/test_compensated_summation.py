@@ -0,0 +1,75 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+from fractions import Fraction
+
+import numpy as np
+
+from ewr_so_se_2024.harmonic_series.compensated_summation import (
+    ERROR_BOUND_FACTORS,
+    error_bound,
+    exact_sum,
+    harmonic_sum_error_bounds,
+    neumaier_sum,
+    pairwise_sum,
+)
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
+    harmonic_sum,
+    harmonic_terms,
+)
+
+
+def exact_harmonic_sum(partial_sum, start, stop, dtype):
+    return Fraction(float(partial_sum)) + sum(
+        map(Fraction, harmonic_terms(start, stop, dtype).tolist())
+    )
+
+
+# Indices beyond the range of float16 overflow to infinity, leaving terms of zero
+@np.errstate(over="ignore")
+def test_error_bounds():
+    for dtype in [np.float16, np.float32, np.float64]:
+        for start, stop in [
+            (0, 0),
+            (0, 1),
+            (3, 20000),
+            (0, 5000),
+            (0, 50000),
+            (65000, 70000),
+        ]:
+            expected = exact_harmonic_sum(dtype(0.25), start, stop, dtype)
+            for summation_algorithm in ERROR_BOUND_FACTORS:
+                result = summation_algorithm(dtype(0.25), start, stop, dtype)
+                assert result.dtype == dtype
+
+                bound = error_bound(
+                    summation_algorithm, float(result), stop - start, dtype
+                )
+                assert bound == np.inf or abs(Fraction(float(result)) - expected) <= (
+                    Fraction(bound)
+                )
+
+
+def test_exact_sum():
+    for dtype in [np.float16, np.float32, np.float64]:
+        expected = exact_harmonic_sum(dtype(0), 0, 5000, dtype)
+        result = exact_sum(dtype(0), 0, 5000, dtype, block_size=777)
+        for neighbour in [
+            np.nextafter(result, dtype(np.inf)),
+            np.nextafter(result, dtype(-np.inf)),
+        ]:
+            assert abs(Fraction(float(result)) - expected) <= abs(
+                Fraction(float(neighbour)) - expected
+            )
+
+
+def test_harmonic_sum_error_bounds():
+    for summation_algorithm in [neumaier_sum, pairwise_sum]:
+        sums = harmonic_sum(0, 4, 10, 6, summation_algorithm, np.float32)
+        bounds = harmonic_sum_error_bounds(
+            0, 4, 10, 6, summation_algorithm, sums, np.float32
+        )
+        assert len(bounds) == len(sums) and bounds == sorted(bounds)
+        expected = exact_harmonic_sum(np.float32(0), 0, 10**4, np.float32)
+        assert abs(Fraction(float(sums[-1])) - expected) <= Fraction(bounds[-1])
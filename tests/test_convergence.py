@@ -0,0 +1,29 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+
+from ewr_so_se_2024.approximation_of_pi.convergence import (
+    calculate_approximations_in_parallel,
+)
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    Chudnovsky,
+    Leibniz,
+    Machin,
+    Spigot,
+)
+
+
+def test_calculate_approximations_in_parallel():
+    sequence_classes = [Spigot, Chudnovsky, Leibniz, Machin]
+    sample_points = [1, 3, 10, 31, 100]
+    with decimal.localcontext(prec=60):
+        serial = [
+            [sequence_class().at(k) for k in sample_points]
+            for sequence_class in sequence_classes
+        ]
+    assert (
+        calculate_approximations_in_parallel(sequence_classes, sample_points, 60, 2)
+        == serial
+    )
@@ -0,0 +1,54 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+from itertools import islice
+
+from ewr_so_se_2024.approximation_of_pi.executor import SequenceJob, run_jobs
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    Chudnovsky,
+    GaussLegendre,
+    Leibniz,
+)
+
+
+def test_sequence_contexts():
+    current_context = decimal.getcontext()
+    low_precision = GaussLegendre.with_precision(50)
+    high_precision = GaussLegendre.with_precision(500)
+    for _ in range(10):
+        next(low_precision)
+        next(high_precision)
+
+    assert decimal.getcontext() is current_context
+    assert decimal.getcontext().prec == 28
+    assert len(low_precision.current_approximation.as_tuple().digits) == 50
+    assert len(high_precision.current_approximation.as_tuple().digits) == 500
+    assert Chudnovsky(context=decimal.Context(prec=500)).at(
+        40
+    ) == Chudnovsky.with_precision(500).at(40)
+
+    # Within the context of the sequence, its elements are computed the same way
+    inside, outside = Leibniz.with_precision(500), Leibniz.with_precision(500)
+    decimal.setcontext(inside.context)
+    try:
+        assert list(islice(inside, 20)) == list(islice(outside, 20))
+        assert decimal.getcontext() is inside.context
+    finally:
+        decimal.setcontext(current_context)
+
+
+def test_run_jobs():
+    jobs = [
+        SequenceJob(sequence_class, precision, position)
+        for sequence_class in [Leibniz, GaussLegendre, Chudnovsky]
+        for precision, position in [(30, 10), (300, 20)]
+    ]
+    approximations = run_jobs(jobs)
+    assert [
+        len(approximation.as_tuple().digits) for approximation in approximations[-2:]
+    ] == [30, 300]
+
+    for pool in ["thread", "process"]:
+        assert run_jobs(jobs, workers=2, pool=pool) == approximations
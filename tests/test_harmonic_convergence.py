@@ -0,0 +1,64 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import tracemalloc
+from functools import reduce
+
+import numpy as np
+
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
+    forward_sum,
+    harmonic_terms,
+    vectorized_sum,
+)
+
+
+def reduce_forward_sum(partial_sum, start, stop, dtype):
+    return reduce(
+        lambda partial_sum, n: partial_sum + dtype(1) / dtype(n),
+        range(start + 1, stop + 1),
+        partial_sum,
+    )
+
+
+# Indices beyond the range of float16 overflow to infinity in both implementations
+@np.errstate(over="ignore")
+def test_forward_sum():
+    for dtype in [np.float16, np.float32, np.float64]:
+        for start, stop in [(0, 0), (0, 1), (0, 1000), (17, 70000), (65000, 66000)]:
+            expected = reduce_forward_sum(dtype(0.5), start, stop, dtype)
+            for chunk_size in [1, 7, 4096]:
+                result = forward_sum(dtype(0.5), start, stop, dtype, chunk_size)
+                assert result.dtype == dtype
+                assert result.tobytes() == expected.tobytes()
+
+
+def test_vectorized_sum():
+    for dtype in [np.float16, np.float32, np.float64]:
+        terms = harmonic_terms(17, 5000, dtype)
+        result = vectorized_sum(dtype(0.5), 17, 5000, dtype, chunk_size=5000)
+        assert (
+            result.tobytes() == np.sum(np.concatenate(([dtype(0.5)], terms))).tobytes()
+        )
+
+        expected = dtype(0.5)
+        for chunk_start in range(0, terms.size, 1000):
+            expected = np.sum(
+                np.concatenate(([expected], terms[chunk_start : chunk_start + 1000]))
+            )
+        result = vectorized_sum(dtype(0.5), 17, 5000, dtype, chunk_size=1000)
+        assert result.tobytes() == expected.tobytes()
+
+
+def test_vectorized_sum_memory():
+    peak_memory = []
+    for stop in [10**4, 10**6]:
+        tracemalloc.start()
+        try:
+            vectorized_sum(np.float64(0), 0, stop, np.float64, chunk_size=1000)
+            peak_memory.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    assert peak_memory[1] < 2 * peak_memory[0] < 10**5
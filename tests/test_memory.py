@@ -0,0 +1,23 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+from ewr_so_se_2024.approximation_of_pi import memory
+from ewr_so_se_2024.approximation_of_pi.sequences import Chudnovsky
+
+
+def test_deep_size_of():
+    shared = list(range(1000))
+    assert memory.deep_size_of([shared, shared]) < 2 * memory.deep_size_of(shared)
+    assert memory.deep_size_of({"values": shared}) > memory.deep_size_of(shared)
+
+
+def test_memory_modes():
+    for mode in ["pickle", "deep", "tracemalloc"]:
+        small = memory.calculate_sequence_memory_size(Chudnovsky, 100, 10, mode)
+        large = memory.calculate_sequence_memory_size(Chudnovsky, 10000, 10, mode)
+        assert 0 < small < large
+
+    assert memory.calculate_isolated_sequence_memory_size(
+        Chudnovsky, 100, 10, "pickle"
+    ) == memory.calculate_sequence_memory_size(Chudnovsky, 100, 10, "pickle")
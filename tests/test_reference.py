@@ -0,0 +1,29 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+from ewr_so_se_2024.approximation_of_pi.reference import (
+    BUNDLED_PI_PATH,
+    PiDigits,
+    compute_pi_digits,
+)
+
+
+def test_pi_digits_store(tmp_path):
+    with open(BUNDLED_PI_PATH, encoding="utf-8") as pi_file:
+        bundled_digits = "".join(filter(str.isdigit, pi_file.read())).encode("ascii")
+    # The last bundled digit is rounded
+    bundled_digits = bundled_digits[:-1]
+
+    store = PiDigits(str(tmp_path / "pi-digits.bcd"))
+    assert store.digits(11) == b"31415926535"
+    assert len(store) == len(bundled_digits)
+
+    assert store.digits(25001)[: len(bundled_digits)] == bundled_digits
+    assert len(store) >= 25001
+    assert PiDigits(store.store_path).digits(25001) == store.digits(25001)
+
+
+def test_compute_pi_digits():
+    assert compute_pi_digits(1) == b"3"
+    assert compute_pi_digits(30) == b"314159265358979323846264338327"
@@ -0,0 +1,73 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+import functools
+
+import pytest
+from click.testing import CliRunner
+
+from ewr_so_se_2024.approximation_of_pi.runtime import (
+    RuntimeAnalysis,
+    main,
+    runtime_result_kind,
+)
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    Chudnovsky,
+    GaussLegendre,
+    Leibniz,
+    Machin,
+    MonteCarlo,
+)
+
+
+def first_positions(sequence_class, digits, search):
+    runtime_analysis = RuntimeAnalysis(sequence_class())
+    positions = []
+    for n in digits:
+        if search:
+            runtime_analysis.search_approximation_up_to(n)
+        else:
+            runtime_analysis.approximation_up_to(n)
+        positions.append(runtime_analysis.sequence.current_position)
+    return positions
+
+
+def test_search_approximation_up_to():
+    with decimal.localcontext(prec=304):
+        for sequence_class in [Chudnovsky, GaussLegendre, Machin]:
+            digits = range(1, 301, 7)
+            assert first_positions(sequence_class, digits, True) == first_positions(
+                sequence_class, digits, False
+            )
+
+        # The correct digits of the Leibniz series go up and down, but only grow
+        # on the positions above and on those below pi
+        assert first_positions(Leibniz, [1, 2, 3, 4], True) == [2, 18, 118, 1687]
+        assert first_positions(Leibniz, [1, 2, 3, 4], False) == [2, 18, 118, 1687]
+
+        # The search advances the sequences by `at`, evaluating Machin in parallel
+        digits = range(1, 301, 37)
+        assert first_positions(
+            functools.partial(Machin, workers=2), digits, True
+        ) == first_positions(Machin, digits, False)
+
+        with pytest.raises(ValueError, match="monotonically"):
+            RuntimeAnalysis(MonteCarlo()).search_approximation_up_to(2)
+
+
+def test_workers_require_search():
+    result = CliRunner().invoke(main, ["-s", "Machin", "--workers", "2"])
+    assert result.exit_code != 0
+    assert "--workers requires --search" in result.output
+
+
+def test_runtime_result_kind():
+    assert runtime_result_kind(False, [1, 2], 1) == runtime_result_kind(False, [2], 1)
+    # Searched timings depend on the previous samples
+    kind = runtime_result_kind(True, [1, 2], 1)
+    assert kind == runtime_result_kind(True, [1, 2], 1)
+    assert kind != runtime_result_kind(True, [2], 1)
+    assert kind != runtime_result_kind(True, [1, 2], 2)
+    assert kind != runtime_result_kind(False, [1, 2], 1)
@@ -0,0 +1,175 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+import pickle
+from decimal import Decimal
+from itertools import islice
+from math import isqrt
+
+from ewr_so_se_2024.approximation_of_pi import utils
+from ewr_so_se_2024.approximation_of_pi.digits import pi_digit_chunks
+from ewr_so_se_2024.approximation_of_pi.fixed_point import (
+    FIXED_POINT_SEQUENCES,
+    FixedPointGaussLegendre,
+    fixed_point_reciprocal_sqrt,
+)
+from ewr_so_se_2024.approximation_of_pi.reference import PI_REFERENCE
+from ewr_so_se_2024.approximation_of_pi.sequences import (
+    APPROXIMATION_SEQUENCES,
+    Chudnovsky,
+    GaussLegendre,
+    Leibniz,
+    Machin,
+    MonteCarlo,
+    Spigot,
+    process_pool,
+    reciprocal_sqrt,
+)
+
+
+def assert_close(x: Decimal, y: Decimal, digits: int):
+    assert abs(x - y) <= Decimal(10) ** -digits, f"{x} != {y}"
+
+
+def test_chudnovsky_random_access():
+    with decimal.localcontext(prec=500):
+        for position in [0, 1, 5, 20, 100]:
+            iterated = Chudnovsky()
+            for _ in range(position + 1):
+                next(iterated)
+
+            assert_close(Chudnovsky().at(position), iterated.current_approximation, 497)
+
+        sequence = Chudnovsky()
+        sequence.at(10)
+        assert sequence.current_position == 10
+        assert sequence.at(5) is None
+        assert_close(next(sequence), Chudnovsky().at(11), 497)
+
+
+def test_monte_carlo_batches():
+    iterated = list(islice(MonteCarlo(seed=1, batch_size=1000), 5000))
+
+    sequence = MonteCarlo(seed=1, batch_size=1000)
+    assert sequence.at(4321) == iterated[4321]
+    assert sequence.at(4999) == iterated[4999]
+    assert MonteCarlo(seed=2, batch_size=1000).at(4999) != iterated[4999]
+    # The samples do not depend on the batch size
+    assert list(islice(MonteCarlo(seed=1, batch_size=777), 5000)) == iterated
+    assert MonteCarlo(seed=1).at(4999) == iterated[4999]
+
+
+def test_monte_carlo_workers():
+    sequence = MonteCarlo(batch_size=100)
+    parallel_sequence = MonteCarlo(batch_size=100, workers=3)
+    started_pools = process_pool.cache_info().misses
+    assert parallel_sequence.at(12345) == sequence.at(12345)
+    assert parallel_sequence.at(54321) == sequence.at(54321)
+    # Both calls were served by the same pool of processes
+    assert process_pool.cache_info().misses <= started_pools + 1
+
+    assert utils.create_sequence("decimal", "MonteCarlo", 3).workers == 3
+    assert utils.create_sequence("integer", "MonteCarlo", 3).workers == 3
+    assert isinstance(utils.create_sequence("decimal", "Leibniz", 3), Leibniz)
+
+
+def test_leibniz_random_access():
+    with decimal.localcontext(prec=50):
+        for position in [0, 1, 2, 7, 1000, 1001]:
+            iterated = Leibniz()
+            for _ in range(position + 1):
+                next(iterated)
+
+            assert_close(Leibniz().at(position), iterated.current_approximation, 45)
+
+        sequence = Leibniz()
+        sequence.at(3)
+        assert_close(sequence.at(10), Leibniz().at(10), 48)
+        assert_close(next(sequence), Leibniz().at(11), 48)
+
+
+def test_fixed_point_backend():
+    with decimal.localcontext(prec=300):
+        for sequence_name, sequence_class in FIXED_POINT_SEQUENCES.items():
+            sequence = APPROXIMATION_SEQUENCES[sequence_name]()
+            fixed_point_sequence = sequence_class()
+            for _ in range(50):
+                assert_close(next(fixed_point_sequence), next(sequence), 295)
+
+            assert_close(fixed_point_sequence.at(60), sequence.at(60), 295)
+
+
+def test_slotted_state():
+    with decimal.localcontext(prec=100):
+        sequence_classes = [
+            *APPROXIMATION_SEQUENCES.values(),
+            *FIXED_POINT_SEQUENCES.values(),
+        ]
+        for sequence_class in sequence_classes:
+            sequence = sequence_class()
+            sequence.at(5)
+            assert not hasattr(sequence, "__dict__")
+
+            restored = pickle.loads(pickle.dumps(sequence))
+            assert restored.current_position == 5
+            assert restored.current_approximation == sequence.current_approximation
+            assert next(restored) == next(sequence)
+
+
+def test_spigot():
+    assert "".join(pi_digit_chunks(300, 1000)).encode() == PI_REFERENCE.digits(1000)
+    assert [len(chunk) for chunk in pi_digit_chunks(4, 10)] == [4, 4, 2]
+
+    with decimal.localcontext(prec=50):
+        assert Spigot().at(4) == Decimal("3.1415")
+        # The 50 digits of the precision are reached at position 49
+        sequence = Spigot()
+        first_digits = sequence.at(49)
+        assert str(first_digits).replace(".", "").encode() == PI_REFERENCE.digits(50)
+        assert sequence.at(50) == first_digits
+        assert len(str(sequence.produced_digits)) == 50
+        assert_close(Spigot().at(60), Chudnovsky().at(60), 49)
+
+
+def test_machin():
+    with decimal.localcontext(prec=300):
+        for formula in ["Machin", "Takano"]:
+            iterated = Machin(formula=formula)
+            for _ in range(21):
+                next(iterated)
+            assert Machin(formula=formula).at(20) == iterated.current_approximation
+
+            approximation = Machin(formula=formula).at(1000)
+            assert_close(approximation, Chudnovsky().at(1000), 298)
+            assert Machin(formula=formula, workers=2).at(1000) == approximation
+
+
+def test_gauss_legendre_precision_schedule():
+    with decimal.localcontext(prec=2010):
+        assert_close(reciprocal_sqrt(Decimal(2), 2010), 1 / Decimal(2).sqrt(), 2005)
+
+    with decimal.localcontext(prec=2000):
+        scheduled = GaussLegendre()
+        unscheduled = GaussLegendre(precision_schedule=False)
+        for _ in range(12):
+            assert_close(next(scheduled), next(unscheduled), 1995)
+
+        sequence = GaussLegendre()
+        assert sequence.at(100) == scheduled.at(100)
+        assert_close(sequence.current_approximation, Chudnovsky().at(200), 1995)
+
+        for precision_schedule in [True, False]:
+            fixed_point_sequence = FixedPointGaussLegendre(
+                precision_schedule=precision_schedule
+            )
+            sequence = GaussLegendre()
+            for _ in range(12):
+                assert_close(next(fixed_point_sequence), next(sequence), 1995)
+
+    bits = 6000
+    assert (
+        abs(fixed_point_reciprocal_sqrt(3 << bits, bits) - isqrt((1 << 2 * bits) // 3))
+        <= 1
+    )
@@ -0,0 +1,66 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import json
+import queue
+
+from click.testing import CliRunner
+
+from ewr_so_se_2024.harmonic_series.harmonic_convergence import (
+    forward_sum,
+    harmonic_sum,
+)
+from ewr_so_se_2024.harmonic_series.sweep import sweep, sweep_combination
+from ewr_so_se_2024.harmonic_series.utils import DATA_TYPES
+
+
+def test_sweep(tmp_path):
+    output = tmp_path / "sweep.json"
+    result = CliRunner().invoke(
+        sweep,
+        [
+            "--stop",
+            "4",
+            "-n",
+            "5",
+            "-t",
+            "float32",
+            "-t",
+            "float64",
+            "-a",
+            "Forward",
+            "-a",
+            "Pairwise",
+            "--jobs",
+            "2",
+            "--no-display",
+            "-o",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+    with open(output, encoding="utf-8") as output_file:
+        results = json.load(output_file)
+    assert results["sample_points"] == [1, 10, 100, 1000, 10000]
+    assert [
+        (result["data_type"], result["summation_algorithm"])
+        for result in results["results"]
+    ] == [
+        ("float32", "Forward"),
+        ("float32", "Pairwise"),
+        ("float64", "Forward"),
+        ("float64", "Pairwise"),
+    ]
+    assert results["results"][0]["sums"] == list(
+        map(float, harmonic_sum(0, 4, 10, 5, forward_sum, DATA_TYPES["float32"]))
+    )
+
+
+def test_sweep_combination_progress():
+    progress = queue.Queue()
+    sums, _ = sweep_combination(0, 4, 10, 5, "float32", "Kahan", progress)
+    assert len(sums) == 5
+    assert [progress.get_nowait() for _ in range(5)] == [1] * 5
+    assert progress.empty()
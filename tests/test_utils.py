@@ -0,0 +1,29 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+
+
+import decimal
+from decimal import Decimal
+
+from ewr_so_se_2024.approximation_of_pi import utils
+
+
+def test_first_mismatching_digit():
+    approximations = [
+        Decimal("nan"),
+        Decimal("0.000"),
+        Decimal("-3.14159"),
+        Decimal("0.00314"),
+        Decimal("3.10"),
+        Decimal("3.2E+5"),
+    ]
+    for precision in [5, 50, 1000]:
+        with decimal.localcontext(prec=precision):
+            approximations.append(+utils.PI)
+            approximations.append(Decimal(22) / Decimal(7))
+
+    for approximation in approximations:
+        first_mismatch = utils.find_first_mismatch(
+            approximation.as_tuple()[1], utils.PI.as_tuple()[1]
+        )
+        assert utils.first_mismatching_digit(approximation) == first_mismatch[0]